@@ -0,0 +1,101 @@
+"""
+Compiled numerical kernels for spectral data.
+
+Numba is optional. When it is not installed the kernels fall back to
+equivalent vectorized NumPy code.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+# Below this many rows the thread start-up cost outweighs a parallel loop
+_PARALLEL_MIN_ROWS = 1024
+
+
+if njit is not None:
+    # fastmath is left off so that NaN inputs propagate exactly like np.min/np.max
+    @njit(cache=True)
+    def _minmax(values):
+        """Compute the minimum and maximum of a 1D array in a single pass."""
+        lo = values[0]
+        hi = values[0]
+        for j in range(values.shape[0]):
+            v = values[j]
+            if v != v:
+                return v, v
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        return lo, hi
+    
+    def _minmax_normalize_rows_loop(intensities, out):
+        """Min-max normalize each row with a fused single-pass min/max reduction."""
+        n_points = intensities.shape[1]
+        for i in prange(intensities.shape[0]):
+            lo = intensities[i, 0]
+            hi = intensities[i, 0]
+            for j in range(n_points):
+                v = intensities[i, j]
+                if v != v:
+                    # A NaN turns the whole row into NaN, as in the NumPy fallback
+                    lo = v
+                    hi = v
+                    break
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            inv = 1.0 / (hi - lo)
+            for j in range(n_points):
+                out[i, j] = (intensities[i, j] - lo) * inv
+    
+    # fastmath is left off here too: it would let the compiler drop the NaN check
+    _minmax_normalize_rows = njit(cache=True, error_model='numpy')(_minmax_normalize_rows_loop)
+    _minmax_normalize_rows_parallel = njit(
+        parallel=True, cache=True, error_model='numpy'
+    )(_minmax_normalize_rows_loop)
+
+
+def minmax(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the minimum and maximum of a non-empty 1D array.
+    
+    Args:
+        values: Array to reduce
+        
+    Returns:
+        Tuple of (minimum, maximum); both NaN if the array contains NaN
+    """
+    if njit is None:
+        return values.min(), values.max()
+    return _minmax(values)
+
+
+def minmax_normalize_rows(intensities: np.ndarray) -> np.ndarray:
+    """
+    Min-max normalize every row of a 2D intensity stack.
+    
+    Args:
+        intensities: Array of shape (n_spectra, n_points); rows containing NaN come out all NaN
+        
+    Returns:
+        New array of the same shape with each row scaled to [0, 1]
+    """
+    if njit is None:
+        lo = intensities.min(axis=1, keepdims=True)
+        hi = intensities.max(axis=1, keepdims=True)
+        return (intensities - lo) / (hi - lo)
+    
+    out = np.empty(intensities.shape, dtype=np.result_type(intensities, 1.0))
+    if intensities.shape[0] >= _PARALLEL_MIN_ROWS:
+        _minmax_normalize_rows_parallel(intensities, out)
+    else:
+        _minmax_normalize_rows(intensities, out)
+    return out
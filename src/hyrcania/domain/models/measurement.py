@@ -2,15 +2,38 @@
 Measurement domain models for organizing spectroscopy data.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from enum import Enum
-from .spectrum import Spectrum, SpectroscopyType
+from enum import IntEnum
+from .spectrum import Spectrum, SpectroscopyType, _ramanspy
 
+# Set HYRCANIA_VALIDATE=0 to skip the per-spectrum type check everywhere
+_VALIDATE = os.environ.get('HYRCANIA_VALIDATE', '1') == '1'
+_skip_spectra_validation: ContextVar[bool] = ContextVar('_skip_spectra_validation', default=False)
 
-class AgingStep(Enum):
-    """Aging steps for olive oil samples."""
+
+@contextmanager
+def skip_spectra_validation():
+    """
+    Skip the per-spectrum type check for measurements created in this block.
+    
+    Only use this when the spectra are known to share the measurement's
+    spectroscopy type, e.g. when a loading strategy built them itself.
+    The setting is local to the current thread.
+    """
+    token = _skip_spectra_validation.set(True)
+    try:
+        yield
+    finally:
+        _skip_spectra_validation.reset(token)
+
+
+class AgingStep(IntEnum):
+    """Aging steps for olive oil samples; members compare equal to their step number."""
     STEP_0 = 0
     STEP_1 = 1
     STEP_2 = 2
@@ -23,25 +46,39 @@ class AgingStep(Enum):
     STEP_9 = 9
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Measurement:
-    """A complete measurement session with multiple spectra."""
+    """
+    A complete measurement session with multiple spectra.
+    
+    Instances are immutable and hash by identity. Lookup indices are built
+    from ``spectra`` at construction time, so the list must not be mutated
+    afterwards; use ``dataclasses.replace`` to derive a new measurement.
+    """
     measurement_id: str
     aging_step: AgingStep
     spectroscopy_type: SpectroscopyType
     spectra: List[Spectrum]
     metadata: Optional[Dict[str, Any]] = None
     timestamp: Optional[datetime] = None
+    _container_cache: Optional[Tuple[int, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _by_name: Dict[str, Spectrum] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_excitation: Dict[Optional[float], List[Spectrum]] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate measurement data."""
         if not self.spectra:
             raise ValueError("Measurement must contain at least one spectrum")
         
-        # Ensure all spectra have the same spectroscopy type
-        for spectrum in self.spectra:
-            if spectrum.spectroscopy_type != self.spectroscopy_type:
+        # Ensure all spectra have the same spectroscopy type (enum members are singletons)
+        if _VALIDATE and not _skip_spectra_validation.get():
+            if any(spectrum.spectroscopy_type is not self.spectroscopy_type for spectrum in self.spectra):
                 raise ValueError("All spectra must have the same spectroscopy type")
+        
+        # Index spectra for constant-time lookups; the first spectrum wins on duplicate names
+        for spectrum in self.spectra:
+            self._by_name.setdefault(spectrum.measurement_name, spectrum)
+            self._by_excitation.setdefault(spectrum.spectral_data.excitation_wavelength, []).append(spectrum)
     
     @property
     def spectrum_count(self) -> int:
@@ -50,28 +87,28 @@ class Measurement:
     
     def get_spectrum_by_name(self, name: str) -> Optional[Spectrum]:
         """Get a spectrum by its measurement name."""
-        for spectrum in self.spectra:
-            if spectrum.measurement_name == name:
-                return spectrum
-        return None
+        return self._by_name.get(name)
     
     def get_spectra_by_excitation(self, excitation_wavelength: float) -> List[Spectrum]:
         """Get all spectra with a specific excitation wavelength."""
-        return [
-            spectrum for spectrum in self.spectra
-            if spectrum.spectral_data.excitation_wavelength == excitation_wavelength
-        ]
+        return list(self._by_excitation.get(excitation_wavelength, []))
     
     def to_ramanspy_container(self):
         """Convert all spectra to a RamanSPy SpectralContainer."""
-        import ramanspy as rp
+        # The cached container is reused as long as no spectra were added or removed
+        if self._container_cache is not None and self._container_cache[0] == len(self.spectra):
+            return self._container_cache[1]
+        
         raman_spectra = [spectrum.to_ramanspy_spectrum() for spectrum in self.spectra]
-        if raman_spectra:
-            return rp.SpectralContainer(raman_spectra, spectral_axis=self.spectra[0].wavelengths)
-        return None
+        if not raman_spectra:
+            return None
+        
+        container = _ramanspy().SpectralContainer(raman_spectra, spectral_axis=self.spectra[0].wavelengths)
+        object.__setattr__(self, '_container_cache', (len(self.spectra), container))
+        return container
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentSession:
     """A complete experiment session with multiple measurements."""
     session_id: str
@@ -91,4 +128,4 @@ class ExperimentSession:
     
     def get_measurements_by_type(self, spectroscopy_type: SpectroscopyType) -> List[Measurement]:
         """Get all measurements of a specific spectroscopy type."""
-        return [m for m in self.measurements if m.spectroscopy_type == spectroscopy_type] 
\ No newline at end of file
+        return [m for m in self.measurements if m.spectroscopy_type is spectroscopy_type] 
\ No newline at end of file
@@ -2,10 +2,12 @@
 Quality assessment domain models for olive oil quality control.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 from datetime import datetime
+import numpy as np
 from .spectrum import Spectrum
 
 
@@ -18,6 +20,25 @@ class QualityGrade(Enum):
     UNKNOWN = "unknown"
 
 
+# Rank of each grade, higher is better
+_GRADE_RANK = {
+    QualityGrade.EXTRA_VIRGIN: 4,
+    QualityGrade.VIRGIN: 3,
+    QualityGrade.LAMPANTE: 2,
+    QualityGrade.REFINED: 1,
+    QualityGrade.UNKNOWN: 0
+}
+
+# Minimum overall score of each grade above REFINED, in ascending order
+_GRADE_CUTOFFS = (60, 80, 90)
+_GRADES_BY_CUTOFF = (QualityGrade.REFINED, QualityGrade.LAMPANTE, QualityGrade.VIRGIN, QualityGrade.EXTRA_VIRGIN)
+_GRADE_BY_RANK = {rank: grade for grade, rank in _GRADE_RANK.items()}
+
+# Array forms of the cutoff tables for vectorized grading
+_GRADE_THRESHOLDS = np.array(_GRADE_CUTOFFS, dtype=np.float64)
+_GRADE_CODES_BY_CUTOFF = np.array([_GRADE_RANK[grade] for grade in _GRADES_BY_CUTOFF], dtype=np.int8)
+
+
 class QualityIndicator(Enum):
     """Quality indicators for olive oil."""
     ACIDITY = "acidity"
@@ -29,9 +50,50 @@ class QualityIndicator(Enum):
     AROMA = "aroma"
 
 
-@dataclass
+# Column order of the metric arrays used for batch scoring
+METRIC_FIELDS = ('acidity', 'peroxide_value', 'k232', 'k270', 'flavor_score', 'aroma_score')
+
+# Extra virgin limits of the chemical indicators (acidity, peroxide value, K232, K270)
+# and how fast their score drops once a limit is exceeded
+_CHEMICAL_LIMITS = np.array([0.8, 20.0, 2.5, 0.22])
+_CHEMICAL_PENALTIES = np.array([50.0, 2.0, 20.0, 200.0])
+
+
+# Compliance bit flags, one per metric in METRIC_FIELDS order
+COMPLIANCE_ACIDITY = 1 << 0
+COMPLIANCE_PEROXIDE_VALUE = 1 << 1
+COMPLIANCE_K232 = 1 << 2
+COMPLIANCE_K270 = 1 << 3
+COMPLIANCE_FLAVOR = 1 << 4
+COMPLIANCE_AROMA = 1 << 5
+_COMPLIANCE_KEYS = (
+    ('acidity', COMPLIANCE_ACIDITY),
+    ('peroxide_value', COMPLIANCE_PEROXIDE_VALUE),
+    ('k232', COMPLIANCE_K232),
+    ('k270', COMPLIANCE_K270),
+    ('flavor', COMPLIANCE_FLAVOR),
+    ('aroma', COMPLIANCE_AROMA)
+)
+_ALL_COMPLIANCE_FLAGS = (1 << len(_COMPLIANCE_KEYS)) - 1
+
+
+def compliance_to_dict(flags: int, present: int = _ALL_COMPLIANCE_FLAGS) -> Dict[str, bool]:
+    """
+    Expand compliance bit flags into a dict keyed by metric name.
+    
+    Args:
+        flags: Bits set for the metrics that comply
+        present: Bits set for the metrics that were measured
+        
+    Returns:
+        Dictionary mapping each measured metric to its compliance
+    """
+    return {key: bool(flags & bit) for key, bit in _COMPLIANCE_KEYS if present & bit}
+
+
+@dataclass(frozen=True, slots=True)
 class QualityMetrics:
-    """Quality metrics for olive oil assessment."""
+    """Quality metrics for olive oil assessment; immutable and hashable by value."""
     acidity: Optional[float] = None  # Free fatty acid content (%)
     peroxide_value: Optional[float] = None  # Peroxide value (meq O2/kg)
     k232: Optional[float] = None  # UV absorption at 232 nm
@@ -41,62 +103,111 @@ class QualityMetrics:
     aroma_score: Optional[float] = None  # Aroma evaluation score
     timestamp: Optional[datetime] = None
     
+    def to_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pack the scored metrics into arrays ordered as METRIC_FIELDS.
+        
+        Returns:
+            Tuple of (values with NaN for missing metrics, presence mask)
+        """
+        raw = [getattr(self, name) for name in METRIC_FIELDS]
+        values = np.array([np.nan if value is None else value for value in raw], dtype=np.float64)
+        mask = np.array([value is not None for value in raw])
+        return values, mask
+    
     def calculate_overall_score(self) -> float:
         """Calculate an overall quality score based on all metrics."""
-        scores = []
-        
-        # Acidity score (lower is better, max 0.8% for extra virgin)
-        if self.acidity is not None:
-            if self.acidity <= 0.8:
-                scores.append(100 - (self.acidity / 0.8) * 20)  # 80-100 points
-            else:
-                scores.append(max(0, 80 - (self.acidity - 0.8) * 50))  # Decreasing score
-        
-        # Peroxide value score (lower is better, max 20 meq/kg for extra virgin)
-        if self.peroxide_value is not None:
-            if self.peroxide_value <= 20:
-                scores.append(100 - (self.peroxide_value / 20) * 20)  # 80-100 points
-            else:
-                scores.append(max(0, 80 - (self.peroxide_value - 20) * 2))
-        
-        # K232 score (lower is better, max 2.5 for extra virgin)
-        if self.k232 is not None:
-            if self.k232 <= 2.5:
-                scores.append(100 - (self.k232 / 2.5) * 20)  # 80-100 points
-            else:
-                scores.append(max(0, 80 - (self.k232 - 2.5) * 20))
-        
-        # K270 score (lower is better, max 0.22 for extra virgin)
-        if self.k270 is not None:
-            if self.k270 <= 0.22:
-                scores.append(100 - (self.k270 / 0.22) * 20)  # 80-100 points
-            else:
-                scores.append(max(0, 80 - (self.k270 - 0.22) * 200))
-        
-        # Sensory scores
-        if self.flavor_score is not None:
-            scores.append(self.flavor_score)
-        
-        if self.aroma_score is not None:
-            scores.append(self.aroma_score)
-        
-        return sum(scores) / len(scores) if scores else 0.0
+        values, mask = self.to_array()
+        return float(self.score_batch(values[None, :], mask[None, :])[0])
+    
+    @staticmethod
+    def score_batch(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Calculate overall quality scores for many samples at once.
+        
+        Chemical indicators score 80-100 points up to their extra virgin limit
+        and lose points linearly beyond it; sensory scores are used as-is.
+        
+        Args:
+            values: Array of shape (n_samples, 6) with columns ordered as METRIC_FIELDS
+            mask: Boolean array of the same shape marking which metrics are present
+            
+        Returns:
+            Array of overall scores, 0.0 for samples without any metric
+        """
+        values = np.asarray(values, dtype=np.float64)
+        mask = np.asarray(mask, dtype=bool)
+        
+        chemical = values[:, :4]
+        scores = np.empty_like(values)
+        scores[:, :4] = np.where(
+            chemical <= _CHEMICAL_LIMITS,
+            100 - (chemical / _CHEMICAL_LIMITS) * 20,
+            np.fmax(0, 80 - (chemical - _CHEMICAL_LIMITS) * _CHEMICAL_PENALTIES)
+        )
+        scores[:, 4:] = values[:, 4:]
+        
+        counts = mask.sum(axis=1)
+        totals = np.where(mask, scores, 0.0).sum(axis=1)
+        return np.divide(totals, counts, out=np.zeros(len(values)), where=counts > 0)
     
     def determine_quality_grade(self) -> QualityGrade:
         """Determine quality grade based on metrics."""
         overall_score = self.calculate_overall_score()
         
-        if overall_score >= 90:
-            return QualityGrade.EXTRA_VIRGIN
-        elif overall_score >= 80:
-            return QualityGrade.VIRGIN
-        elif overall_score >= 60:
-            return QualityGrade.LAMPANTE
-        else:
+        # Written as a negated >= so that NaN scores fall through to REFINED
+        if not overall_score >= _GRADE_CUTOFFS[0]:
             return QualityGrade.REFINED
+        return _GRADES_BY_CUTOFF[bisect_right(_GRADE_CUTOFFS, overall_score)]
+
+
+def overall_score(
+    acidity=None,
+    peroxide_value=None,
+    k232=None,
+    k270=None,
+    flavor_score=None,
+    aroma_score=None
+) -> np.ndarray:
+    """
+    Calculate overall quality scores from scalar or array metrics.
+    
+    Inputs broadcast against each other. A metric passed as None is missing
+    for every sample; NaN entries mark it missing for single samples.
+    
+    Returns:
+        Array of overall scores with the broadcast shape of the inputs
+    """
+    metrics = (acidity, peroxide_value, k232, k270, flavor_score, aroma_score)
+    columns = np.broadcast_arrays(*[np.asarray(np.nan if m is None else m, dtype=np.float64) for m in metrics])
+    values = np.stack(columns, axis=-1).reshape(-1, len(METRIC_FIELDS))
+    return QualityMetrics.score_batch(values, ~np.isnan(values)).reshape(columns[0].shape)
+
+
+def grade_codes(scores) -> np.ndarray:
+    """
+    Map overall scores to integer grade codes.
+    
+    Codes are the grade ranks (4 = extra virgin down to 1 = refined);
+    convert them back with grade_from_code.
+    
+    Returns:
+        int8 array with the shape of ``scores``
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    # side='right' matches bisect_right in determine_quality_grade; searchsorted
+    # sorts NaN past every cutoff, so NaN scores are sent to the REFINED slot
+    index = np.searchsorted(_GRADE_THRESHOLDS, scores, side='right')
+    index = np.where(np.isnan(scores), 0, index)
+    return _GRADE_CODES_BY_CUTOFF[index]
+
 
+def grade_from_code(code: int) -> QualityGrade:
+    """Convert a grade code from grade_codes back to a QualityGrade."""
+    return _GRADE_BY_RANK[int(code)]
 
-@dataclass
+
+@dataclass(slots=True)
 class QualityThreshold:
     """Quality thresholds for different grades."""
     grade: QualityGrade
@@ -107,32 +218,59 @@ class QualityThreshold:
     min_flavor_score: float
     min_aroma_score: float
     
-    def check_compliance(self, metrics: QualityMetrics) -> Dict[str, bool]:
-        """Check if metrics comply with this threshold."""
-        compliance = {}
+    def compliance_flags(self, metrics: QualityMetrics) -> int:
+        """Check compliance as a bitmask with one COMPLIANCE_* bit per passing metric."""
+        flags = 0
         
-        if metrics.acidity is not None:
-            compliance['acidity'] = metrics.acidity <= self.max_acidity
+        if metrics.acidity is not None and metrics.acidity <= self.max_acidity:
+            flags |= COMPLIANCE_ACIDITY
         
-        if metrics.peroxide_value is not None:
-            compliance['peroxide_value'] = metrics.peroxide_value <= self.max_peroxide_value
+        if metrics.peroxide_value is not None and metrics.peroxide_value <= self.max_peroxide_value:
+            flags |= COMPLIANCE_PEROXIDE_VALUE
         
-        if metrics.k232 is not None:
-            compliance['k232'] = metrics.k232 <= self.max_k232
+        if metrics.k232 is not None and metrics.k232 <= self.max_k232:
+            flags |= COMPLIANCE_K232
         
-        if metrics.k270 is not None:
-            compliance['k270'] = metrics.k270 <= self.max_k270
+        if metrics.k270 is not None and metrics.k270 <= self.max_k270:
+            flags |= COMPLIANCE_K270
         
-        if metrics.flavor_score is not None:
-            compliance['flavor'] = metrics.flavor_score >= self.min_flavor_score
+        if metrics.flavor_score is not None and metrics.flavor_score >= self.min_flavor_score:
+            flags |= COMPLIANCE_FLAVOR
         
-        if metrics.aroma_score is not None:
-            compliance['aroma'] = metrics.aroma_score >= self.min_aroma_score
+        if metrics.aroma_score is not None and metrics.aroma_score >= self.min_aroma_score:
+            flags |= COMPLIANCE_AROMA
+        
+        return flags
+    
+    def check_compliance(self, metrics: QualityMetrics) -> Dict[str, bool]:
+        """Check if metrics comply with this threshold."""
+        present = 0
+        for name, (_, bit) in zip(METRIC_FIELDS, _COMPLIANCE_KEYS):
+            if getattr(metrics, name) is not None:
+                present |= bit
+        
+        return compliance_to_dict(self.compliance_flags(metrics), present)
+    
+    def check_compliance_batch(self, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Check compliance for many samples at once.
         
-        return compliance
+        Args:
+            values: Array of shape (n_samples, 6) with columns ordered as METRIC_FIELDS
+            mask: Boolean array of the same shape marking which metrics are present
+            
+        Returns:
+            uint8 array of COMPLIANCE_* bit flags per sample
+        """
+        values = np.asarray(values, dtype=np.float64)
+        passed = np.empty(values.shape, dtype=bool)
+        passed[:, :4] = values[:, :4] <= [self.max_acidity, self.max_peroxide_value, self.max_k232, self.max_k270]
+        passed[:, 4:] = values[:, 4:] >= [self.min_flavor_score, self.min_aroma_score]
+        passed &= np.asarray(mask, dtype=bool)
+        return np.packbits(passed, axis=1, bitorder='little')[:, 0]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpectralQualityAssessment:
     """Quality assessment based on spectral data."""
     spectrum: Spectrum
@@ -145,12 +283,4 @@ class SpectralQualityAssessment:
     
     def is_acceptable_quality(self, min_grade: QualityGrade = QualityGrade.VIRGIN) -> bool:
         """Check if the quality meets minimum requirements."""
-        grade_hierarchy = {
-            QualityGrade.EXTRA_VIRGIN: 4,
-            QualityGrade.VIRGIN: 3,
-            QualityGrade.LAMPANTE: 2,
-            QualityGrade.REFINED: 1,
-            QualityGrade.UNKNOWN: 0
-        }
-        
-        return grade_hierarchy[self.quality_grade] >= grade_hierarchy[min_grade] 
\ No newline at end of file
+        return _GRADE_RANK[self.quality_grade] >= _GRADE_RANK[min_grade] 
\ No newline at end of file
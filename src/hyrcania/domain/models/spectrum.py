@@ -2,11 +2,45 @@
 Core spectrum domain models for spectroscopy data.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import InitVar, dataclass, field, replace
+from typing import Any, List, Optional, Tuple
 import numpy as np
 from enum import Enum
 
+from ._kernels import minmax, minmax_normalize_rows
+
+# Spectra per block in SpectralBatch.blocked: one AVX-512 register of float32 lanes
+_BLOCK_SIZE = 16
+
+_rp = None
+
+
+def _ramanspy():
+    """Import RamanSPy on first use and reuse the module afterwards."""
+    global _rp
+    if _rp is None:
+        import ramanspy
+        _rp = ramanspy
+    return _rp
+
+
+def _array_module(arr: Any) -> Any:
+    """Return the array module owning ``arr``: CuPy for device arrays, NumPy otherwise."""
+    # Checking the type's module avoids importing CuPy for host arrays
+    if type(arr).__module__.split('.')[0] == 'cupy':
+        import cupy
+        return cupy
+    return np
+
+
+def _default_device_module() -> Any:
+    """Return CuPy when it is installed and NumPy otherwise."""
+    try:
+        import cupy
+    except ImportError:  # CuPy is optional, batches then stay on the CPU
+        return np
+    return cupy
+
 
 class SpectroscopyType(Enum):
     """Types of spectroscopy measurements."""
@@ -15,33 +49,79 @@ class SpectroscopyType(Enum):
     RAMAN = "raman"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class SpectralData:
-    """Core spectral data structure with scientific metadata."""
+    """
+    Core spectral data structure with scientific metadata.
+    
+    Instances are immutable and hash by identity, so they can be used as
+    set members and dict keys. Wavelengths and intensities are stored as
+    contiguous arrays of ``dtype`` (float32 by default, None keeps the input
+    dtype); arrays that already match are kept without copying. The arrays
+    must not be modified in place, since their ranges are cached.
+    """
     wavelengths: np.ndarray
     intensities: np.ndarray
     spectroscopy_type: SpectroscopyType
     excitation_wavelength: Optional[float] = None
     emission_wavelength: Optional[float] = None
     measurement_conditions: Optional[dict] = None
+    dtype: InitVar[Any] = np.float32
+    _wavelength_range: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False)
+    _intensity_range: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False)
     
-    def __post_init__(self):
+    def __post_init__(self, dtype):
         """Validate spectral data after initialization."""
+        object.__setattr__(self, 'wavelengths', np.ascontiguousarray(self.wavelengths, dtype=dtype))
+        object.__setattr__(self, 'intensities', np.ascontiguousarray(self.intensities, dtype=dtype))
+        
         if len(self.wavelengths) != len(self.intensities):
             raise ValueError("Wavelengths and intensities must have the same length")
         
         if len(self.wavelengths) == 0:
             raise ValueError("Spectral data cannot be empty")
     
+    @classmethod
+    def _from_validated(
+        cls,
+        wavelengths: np.ndarray,
+        intensities: np.ndarray,
+        spectroscopy_type: SpectroscopyType,
+        excitation_wavelength: Optional[float] = None
+    ) -> 'SpectralData':
+        """
+        Build an instance from arrays that already satisfy __post_init__.
+        
+        Skips the dataclass __init__ and its checks, so callers must pass
+        contiguous, equal-length, non-empty arrays of the storage dtype.
+        """
+        data = object.__new__(cls)
+        object.__setattr__(data, 'wavelengths', wavelengths)
+        object.__setattr__(data, 'intensities', intensities)
+        object.__setattr__(data, 'spectroscopy_type', spectroscopy_type)
+        object.__setattr__(data, 'excitation_wavelength', excitation_wavelength)
+        object.__setattr__(data, 'emission_wavelength', None)
+        object.__setattr__(data, 'measurement_conditions', None)
+        object.__setattr__(data, '_wavelength_range', None)
+        object.__setattr__(data, '_intensity_range', None)
+        return data
+    
     @property
     def wavelength_range(self) -> Tuple[float, float]:
-        """Get the wavelength range of the spectrum."""
-        return float(self.wavelengths.min()), float(self.wavelengths.max())
+        """Get the wavelength range of the spectrum, computed on first access and cached."""
+        if self._wavelength_range is None:
+            lo, hi = minmax(self.wavelengths)
+            # Frozen dataclass: the cache slot is filled through object.__setattr__
+            object.__setattr__(self, '_wavelength_range', (float(lo), float(hi)))
+        return self._wavelength_range
     
     @property
     def intensity_range(self) -> Tuple[float, float]:
-        """Get the intensity range of the spectrum."""
-        return float(self.intensities.min()), float(self.intensities.max())
+        """Get the intensity range of the spectrum, computed on first access and cached."""
+        if self._intensity_range is None:
+            lo, hi = minmax(self.intensities)
+            object.__setattr__(self, '_intensity_range', (float(lo), float(hi)))
+        return self._intensity_range
     
     @property
     def data_points(self) -> int:
@@ -63,18 +143,249 @@ class SpectralData:
             spectroscopy_type=self.spectroscopy_type,
             excitation_wavelength=self.excitation_wavelength,
             emission_wavelength=self.emission_wavelength,
-            measurement_conditions=self.measurement_conditions
+            measurement_conditions=self.measurement_conditions,
+            dtype=None
         )
+    
+    @staticmethod
+    def normalize_batch(spectra: List['SpectralData'], method: str = "minmax") -> List['SpectralData']:
+        """
+        Normalize many spectra at once.
+        
+        Spectra of equal length are stacked into one contiguous buffer and
+        normalized in a single pass; otherwise each one is normalized on its own.
+        """
+        if not spectra:
+            return []
+        
+        if len({data.data_points for data in spectra}) != 1:
+            return [data.normalize(method) for data in spectra]
+        
+        normalized = _normalize_rows(np.stack([data.intensities for data in spectra]), method)
+        return [replace(data, intensities=row, dtype=None) for data, row in zip(spectra, normalized)]
 
 
-@dataclass
+class SpectralBatch:
+    """
+    Spectra sharing one wavelength grid, stored as a single 2D intensity matrix.
+    
+    Row ``i`` of ``intensities`` is the i-th spectrum, so batch operations run
+    as one NumPy call over contiguous memory instead of one call per spectrum.
+    Arrays are stored as ``dtype`` (float32 by default, None keeps the input dtype).
+    The arrays may live on a GPU as CuPy arrays (see to_device); reductions
+    then run on the device through the same code.
+    """
+    __slots__ = ('wavelengths', 'intensities', 'spectroscopy_type', 'excitation_wavelengths')
+    
+    def __init__(
+        self,
+        wavelengths: np.ndarray,
+        intensities: np.ndarray,
+        spectroscopy_type: SpectroscopyType,
+        excitation_wavelengths: Optional[List[Optional[float]]] = None,
+        dtype: Any = np.float32
+    ):
+        xp = _array_module(intensities)
+        wavelengths = xp.asarray(wavelengths, dtype=dtype)
+        intensities = xp.asarray(intensities, dtype=dtype)
+        
+        if intensities.ndim != 2:
+            raise ValueError("Intensities must be a 2D array of shape (n_spectra, n_points)")
+        
+        if intensities.shape[1] != len(wavelengths):
+            raise ValueError("Wavelengths and intensities must have the same length")
+        
+        if intensities.size == 0:
+            raise ValueError("Spectral batch cannot be empty")
+        
+        if excitation_wavelengths is None:
+            excitation_wavelengths = [None] * intensities.shape[0]
+        elif len(excitation_wavelengths) != intensities.shape[0]:
+            raise ValueError("Expected one excitation wavelength per spectrum")
+        
+        self.wavelengths = wavelengths
+        self.intensities = intensities
+        self.spectroscopy_type = spectroscopy_type
+        self.excitation_wavelengths = list(excitation_wavelengths)
+    
+    @classmethod
+    def from_list(cls, spectra: List[SpectralData]) -> 'SpectralBatch':
+        """Stack spectra that share a wavelength grid and spectroscopy type into a batch."""
+        if not spectra:
+            raise ValueError("Spectral batch cannot be empty")
+        
+        first = spectra[0]
+        for data in spectra[1:]:
+            if data.wavelengths is not first.wavelengths and not np.array_equal(data.wavelengths, first.wavelengths):
+                raise ValueError("All spectra in a batch must share the same wavelength grid")
+            if data.spectroscopy_type is not first.spectroscopy_type:
+                raise ValueError("All spectra in a batch must have the same spectroscopy type")
+        
+        return cls(
+            wavelengths=first.wavelengths,
+            intensities=np.stack([data.intensities for data in spectra]),
+            spectroscopy_type=first.spectroscopy_type,
+            excitation_wavelengths=[data.excitation_wavelength for data in spectra],
+            dtype=None
+        )
+    
+    def __len__(self) -> int:
+        return self.intensities.shape[0]
+    
+    @property
+    def data_points(self) -> int:
+        """Get the number of data points per spectrum."""
+        return len(self.wavelengths)
+    
+    @property
+    def wavelength_range(self) -> Tuple[float, float]:
+        """Get the wavelength range shared by all spectra."""
+        if _array_module(self.wavelengths) is not np:
+            return float(self.wavelengths.min()), float(self.wavelengths.max())
+        lo, hi = minmax(self.wavelengths)
+        return float(lo), float(hi)
+    
+    @property
+    def intensity_ranges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the per-spectrum intensity minima and maxima."""
+        return self.intensities.min(axis=1), self.intensities.max(axis=1)
+    
+    def mean_spectrum(self) -> np.ndarray:
+        """Get the mean intensity at each wavelength across all spectra."""
+        return self.intensities.mean(axis=0)
+    
+    def blocked(self, block_size: int = _BLOCK_SIZE) -> np.ndarray:
+        """
+        Get the intensities in a blocked (AoSoA) layout.
+        
+        Spectra are grouped into blocks of ``block_size``; within a block the
+        values of one wavelength are contiguous, so reductions across spectra
+        read whole SIMD lanes instead of strided rows. The last block is
+        zero-padded, so no tail handling is needed.
+        
+        Args:
+            block_size: Number of spectra per block
+            
+        Returns:
+            Array of shape (ceil(n_spectra / block_size), n_points, block_size)
+        """
+        xp = _array_module(self.intensities)
+        n_spectra, n_points = self.intensities.shape
+        n_blocks = -(-n_spectra // block_size)
+        padded = xp.zeros((n_blocks * block_size, n_points), dtype=self.intensities.dtype)
+        padded[:n_spectra] = self.intensities
+        return xp.ascontiguousarray(padded.reshape(n_blocks, block_size, n_points).transpose(0, 2, 1))
+    
+    def mean_over_samples(self, blocks: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the mean intensity at each wavelength from a blocked layout.
+        
+        Args:
+            blocks: Result of blocked(), kept by callers that reduce repeatedly;
+                without it this is the same as mean_spectrum()
+            
+        Returns:
+            Array of n_points mean intensities
+        """
+        if blocks is None:
+            return self.mean_spectrum()
+        # Zero padding adds nothing to the sums, so divide by the real spectrum count
+        return blocks.sum(axis=2).sum(axis=0) / len(self)
+    
+    def normalize(self, method: str = "minmax") -> 'SpectralBatch':
+        """Normalize every spectrum in the batch."""
+        return SpectralBatch(
+            wavelengths=self.wavelengths,
+            intensities=_normalize_rows(self.intensities, method),
+            spectroscopy_type=self.spectroscopy_type,
+            excitation_wavelengths=self.excitation_wavelengths,
+            dtype=None
+        )
+    
+    def to_device(self, xp: Any = None) -> 'SpectralBatch':
+        """
+        Move the batch to the array module ``xp``.
+        
+        Moving to the GPU only pays off for large batches (roughly ten
+        million values or more), where reductions become bandwidth bound.
+        
+        Args:
+            xp: ``cupy`` or ``numpy``; defaults to CuPy when installed, else NumPy
+            
+        Returns:
+            SpectralBatch whose arrays belong to ``xp``, or self if they already do
+        """
+        if xp is None:
+            xp = _default_device_module()
+        if _array_module(self.intensities) is xp:
+            return self
+        
+        if xp is np:
+            wavelengths, intensities = self.wavelengths.get(), self.intensities.get()
+        else:
+            wavelengths, intensities = xp.asarray(self.wavelengths), xp.asarray(self.intensities)
+        
+        return SpectralBatch(
+            wavelengths=wavelengths,
+            intensities=intensities,
+            spectroscopy_type=self.spectroscopy_type,
+            excitation_wavelengths=self.excitation_wavelengths,
+            dtype=None
+        )
+    
+    def to_spectral_data(self) -> List[SpectralData]:
+        """Split the batch into SpectralData objects whose arrays are views into the batch."""
+        # SpectralData holds host arrays, so device batches are copied back first
+        if _array_module(self.intensities) is not np:
+            return self.to_device(np).to_spectral_data()
+        
+        # The batch has already checked shapes and dtype, so contiguous rows
+        # can skip the per-spectrum validation in SpectralData.__post_init__
+        if self.wavelengths.flags.c_contiguous and self.intensities.strides[1] == self.intensities.itemsize:
+            return [
+                SpectralData._from_validated(self.wavelengths, row, self.spectroscopy_type, excitation_wavelength)
+                for row, excitation_wavelength in zip(self.intensities, self.excitation_wavelengths)
+            ]
+        
+        return [
+            SpectralData(
+                wavelengths=self.wavelengths,
+                intensities=row,
+                spectroscopy_type=self.spectroscopy_type,
+                excitation_wavelength=excitation_wavelength,
+                dtype=None
+            )
+            for row, excitation_wavelength in zip(self.intensities, self.excitation_wavelengths)
+        ]
+
+
+def _normalize_rows(intensities: np.ndarray, method: str) -> np.ndarray:
+    """Normalize each row of a 2D intensity stack."""
+    if method == "minmax":
+        if _array_module(intensities) is not np:
+            lo = intensities.min(axis=1, keepdims=True)
+            return (intensities - lo) / (intensities.max(axis=1, keepdims=True) - lo)
+        return minmax_normalize_rows(intensities)
+    elif method == "zscore":
+        return (intensities - intensities.mean(axis=1, keepdims=True)) / intensities.std(axis=1, keepdims=True)
+    else:
+        raise ValueError(f"Unknown normalization method: {method}")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Spectrum:
-    """A single spectrum measurement with metadata."""
+    """
+    A single spectrum measurement with metadata.
+    
+    Instances are immutable and hash by identity, so they can be used as
+    set members and dict keys.
+    """
     spectral_data: SpectralData
     measurement_name: str
     aging_step: Optional[int] = None
     sample_id: Optional[str] = None
     timestamp: Optional[str] = None
+    _ramanspy_spectrum: Any = field(default=None, init=False, repr=False)
     
     @property
     def wavelengths(self) -> np.ndarray:
@@ -88,13 +399,19 @@ class Spectrum:
     def spectroscopy_type(self) -> SpectroscopyType:
         return self.spectral_data.spectroscopy_type
     
+    @property
+    def ramanspy_spectrum(self):
+        """RamanSPy Spectrum object, built on first access and cached."""
+        if self._ramanspy_spectrum is None:
+            # Frozen dataclass: the cache slot is filled through object.__setattr__
+            object.__setattr__(self, '_ramanspy_spectrum', _ramanspy().Spectrum(self.intensities, self.wavelengths))
+        return self._ramanspy_spectrum
+    
     def to_ramanspy_spectrum(self):
         """Convert to RamanSPy Spectrum object."""
-        import ramanspy as rp
-        return rp.Spectrum(self.intensities, self.wavelengths)
+        return self.ramanspy_spectrum
     
     def to_ramanspy_container(self):
         """Convert to RamanSPy SpectralContainer."""
-        import ramanspy as rp
         spectrum = self.to_ramanspy_spectrum()
-        return rp.SpectralContainer([spectrum], spectral_axis=self.wavelengths) 
\ No newline at end of file
+        return _ramanspy().SpectralContainer([spectrum], spectral_axis=self.wavelengths) 
\ No newline at end of file
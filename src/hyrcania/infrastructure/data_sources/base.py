@@ -2,34 +2,235 @@
 Base strategy interface for spectroscopy data loading.
 """
 
+import csv
+import logging
+import os
+import re
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from pathlib import Path
-import pandas as pd
 import numpy as np
 
-from hyrcania.domain.models.spectrum import Spectrum, SpectralData, SpectroscopyType
-from hyrcania.domain.models.measurement import Measurement, AgingStep
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional, fall back to the pandas C parser
+    pa = None
+    pa_csv = None
+
+from hyrcania.domain.models.spectrum import Spectrum, SpectralBatch, SpectralData, SpectroscopyType
+from hyrcania.domain.models.measurement import Measurement, AgingStep, skip_spectra_validation
+
+logger = logging.getLogger(__name__)
+
+# Set HYRCANIA_CSV_CACHE=1 to keep a parsed .npy copy next to each CSV file
+_CSV_CACHE = os.environ.get('HYRCANIA_CSV_CACHE', '0') == '1'
+
+_AGING_STEP_RE = re.compile(r'AS(\d)')
+
+
+@lru_cache(maxsize=4096)
+def _aging_step_from_name(filename: str) -> AgingStep:
+    """Map a file name to its aging step; the lowest ASn tag wins."""
+    steps = _AGING_STEP_RE.findall(filename)
+    return AgingStep(int(min(steps))) if steps else AgingStep.STEP_0
+
+
+# Read-only wavelength axes shared across files, keyed by (first, last, length)
+_SHARED_AXES: Dict[Tuple[float, float, int], np.ndarray] = {}
+_MAX_SHARED_AXES = 256
+
+
+def _intern_axis(axis: np.ndarray) -> np.ndarray:
+    """
+    Return one shared, read-only copy of a wavelength axis.
+    
+    Files measured on the same grid then reference a single array instead of
+    each keeping its own. A cached axis is only reused after an exact
+    comparison, so grids that merely share their key are never conflated.
+    
+    Args:
+        axis: Wavelength axis of one file
+        
+    Returns:
+        The interned axis, or ``axis`` itself if it cannot be interned
+    """
+    if len(axis) == 0:
+        return axis
+    
+    key = (float(axis[0]), float(axis[-1]), len(axis))
+    cached = _SHARED_AXES.get(key)
+    if cached is not None:
+        return cached if np.array_equal(cached, axis) else axis
+    if len(_SHARED_AXES) >= _MAX_SHARED_AXES:
+        return axis
+    
+    interned = np.array(axis)
+    interned.flags.writeable = False
+    return _SHARED_AXES.setdefault(key, interned)
+
+
+# Cells the pandas parser reads as missing by default, so pyarrow agrees with it
+_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+def _report_non_numeric(file_path: Path, column_name: Any) -> None:
+    """Warn that a CSV column holds non-numeric cells and will be skipped."""
+    logger.warning("Non-numeric values in column %s of %s; skipping its spectrum", column_name, file_path)
+
+
+def _coerce_cells(cells: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert the cells of a text column to float32 one by one.
+    
+    Args:
+        cells: Cell values, with None for missing cells
+        
+    Returns:
+        Tuple of (values, mask of non-numeric cells); both missing and
+        non-numeric cells are NaN in the values
+    """
+    values = np.full(len(cells), np.nan, dtype=np.float32)
+    non_numeric = np.zeros(len(cells), dtype=bool)
+    for j, cell in enumerate(cells):
+        if cell is None:
+            continue
+        try:
+            values[j] = float(cell)
+        except (TypeError, ValueError):
+            non_numeric[j] = True
+    return values, non_numeric
+
+
+def _drop_non_numeric_pairs(file_path: Path, columns: List[str], arr: np.ndarray, non_numeric: np.ndarray) -> None:
+    """
+    Blank out the column pairs that use a non-numeric cell.
+    
+    A pair only drops the rows where either of its values is missing, so a
+    non-numeric cell in such a row is never used and the pair is kept. Any
+    other non-numeric cell makes its pair unusable and the whole pair is set
+    to NaN, leaving the other spectra of the file intact.
+    
+    Args:
+        file_path: Path to the CSV file, for the warning
+        columns: Column names
+        arr: Parsed array, with NaN for non-numeric cells; modified in place
+        non_numeric: Mask of the non-numeric cells of ``arr``
+    """
+    missing = np.isnan(arr) & ~non_numeric
+    for i in range(0, arr.shape[1] - 1, 2):
+        used = ~(missing[:, i] | missing[:, i + 1])
+        unusable = [j for j in (i, i + 1) if (non_numeric[:, j] & used).any()]
+        for j in unusable:
+            _report_non_numeric(file_path, columns[j])
+        if unusable:
+            arr[:, i:i + 2] = np.nan
+
+
+def _read_header(file_path: Path) -> List[str]:
+    """Read the column names from the first line of a CSV file."""
+    with open(file_path, encoding='latin-1', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def _write_cache(cache_path: Path, arr: np.ndarray) -> None:
+    """
+    Save a parsed CSV array as a .npy file, replacing it atomically.
+    
+    The array is written to a temporary file first, so concurrent loaders
+    never map a partially written cache.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, arr)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write CSV cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
 
 
 class SpectroscopyStrategy(ABC):
-    """Abstract base class for different spectroscopy data loading strategies."""
+    """
+    Abstract base class for different spectroscopy data loading strategies.
+    
+    Strategies must not keep per-call state: the factory hands out one shared
+    instance per spectroscopy type, possibly to several threads at once.
+    """
     
     def __init__(self, spectroscopy_type: SpectroscopyType):
         self.spectroscopy_type = spectroscopy_type
     
-    @abstractmethod
     def load_data(self, file_path: Path) -> List[SpectralData]:
         """
         Load spectral data from a file.
         
+        Spectra loaded from the same file may share one wavelengths array,
+        so the returned arrays must be treated as read-only.
+        
         Args:
             file_path: Path to the data file
             
         Returns:
-            List of SpectralData objects
+            List of SpectralData objects, empty if the file could not be read
         """
-        pass
+        try:
+            columns, arr = self._read_csv(file_path)
+            nan_mask = np.isnan(arr)
+            axis_mask = self._shared_axis_mask(arr, nan_mask)
+            
+            # Files on one shared axis are split from a batch of views
+            batch = self._to_batch(columns, arr, nan_mask, axis_mask)
+            if batch is not None:
+                return batch.to_spectral_data()
+            
+            excitation_wavelengths = self._excitation_wavelengths(columns[0::2])
+            
+            def build(k, wavelengths, intensities):
+                return SpectralData(
+                    wavelengths=wavelengths,
+                    intensities=intensities,
+                    spectroscopy_type=self.spectroscopy_type,
+                    excitation_wavelength=None if excitation_wavelengths is None else excitation_wavelengths[k]
+                )
+            
+            # Extract all wavelength-intensity pairs (every 2 columns)
+            return self._build_spectral_data(self._extract_all_spectra(arr, nan_mask, axis_mask), build)
+            
+        except Exception:
+            logger.exception("Error loading %s file %s", self.spectroscopy_type.value, file_path)
+            return []
+    
+    def load_batch(self, file_path: Path) -> SpectralBatch:
+        """
+        Load all spectra of a file as one SpectralBatch.
+        
+        This is the cheapest way to load a file: no per-spectrum objects are
+        built, and the intensity matrix is a view into the parsed CSV unless
+        the wavelength axis has empty rows, in which case it is copied once.
+        The batch's wavelengths array may be shared and must be treated as
+        read-only.
+        
+        Args:
+            file_path: Path to the data file
+            
+        Returns:
+            SpectralBatch holding every spectrum of the file
+            
+        Raises:
+            ValueError: If the spectra do not share one gap-free wavelength axis
+        """
+        columns, arr = self._read_csv(file_path)
+        nan_mask = np.isnan(arr)
+        batch = self._to_batch(columns, arr, nan_mask, self._shared_axis_mask(arr, nan_mask))
+        if batch is None:
+            raise ValueError(f"Spectra in {file_path} do not share one gap-free wavelength axis")
+        return batch
     
     @abstractmethod
     def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
@@ -77,58 +278,349 @@ class SpectroscopyStrategy(ABC):
             # Extract metadata
             metadata = self.extract_metadata(file_path)
             
+            # File-level attributes are shared by every spectrum
+            aging_step = self._extract_aging_step(file_path)
+            aging_step_value = aging_step.value
+            sample_id = self._extract_sample_id(file_path)
+            timestamp = metadata.get('timestamp')
+            
             # Create spectra
-            spectra = []
-            for i, spectral_data in enumerate(spectral_data_list):
-                spectrum = Spectrum(
+            spectra = [
+                Spectrum(
                     spectral_data=spectral_data,
                     measurement_name=f"spectrum_{i}",
-                    aging_step=self._extract_aging_step(file_path).value,
-                    sample_id=self._extract_sample_id(file_path),
-                    timestamp=metadata.get('timestamp')
+                    aging_step=aging_step_value,
+                    sample_id=sample_id,
+                    timestamp=timestamp
+                )
+                for i, spectral_data in enumerate(spectral_data_list)
+            ]
+            
+            # Create measurement; the spectra all come from this strategy's own loader
+            with skip_spectra_validation():
+                measurement = Measurement(
+                    measurement_id=file_path.stem,
+                    aging_step=aging_step,
+                    spectroscopy_type=self.spectroscopy_type,
+                    spectra=spectra,
+                    metadata=metadata
                 )
-                spectra.append(spectrum)
-            
-            # Create measurement
-            measurement = Measurement(
-                measurement_id=file_path.stem,
-                aging_step=self._extract_aging_step(file_path),
-                spectroscopy_type=self.spectroscopy_type,
-                spectra=spectra,
-                metadata=metadata
-            )
             
             return measurement
             
-        except Exception as e:
-            print(f"Error creating measurement from {file_path}: {e}")
+        except Exception:
+            logger.exception("Error creating measurement from %s", file_path)
+            return None
+    
+    def _read_csv(self, file_path: Path) -> Tuple[List[str], np.ndarray]:
+        """
+        Read a spectral CSV file into its header and a single float32 array.
+        
+        Values are parsed straight to float32, which is ample precision for
+        spectroscopy data and halves the memory of every downstream pass.
+        The array is Fortran-ordered so every column is contiguous in memory.
+        Empty cells are returned as NaN.
+        
+        With HYRCANIA_CSV_CACHE=1 the array is also saved next to the CSV
+        as ``<name>.csv.npy``, and later reads memory-map that file read-only
+        instead of parsing again, as long as it is newer than the CSV and
+        matches its header.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            Tuple of (column names, array of shape (rows, columns))
+        """
+        if not _CSV_CACHE:
+            return self._parse_csv(file_path)
+        
+        cache_path = file_path.with_name(f"{file_path.name}.npy")
+        try:
+            if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+                columns = _read_header(file_path)
+                arr = np.load(cache_path, mmap_mode='r')
+                if arr.ndim == 2 and arr.shape[1] == len(columns) and arr.dtype == np.float32:
+                    return columns, arr
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache: parse the CSV and rewrite it
+        
+        columns, arr = self._parse_csv(file_path)
+        _write_cache(cache_path, arr)
+        return columns, arr
+    
+    def _parse_csv(self, file_path: Path) -> Tuple[List[str], np.ndarray]:
+        """
+        Parse a spectral CSV file into its header and a Fortran-ordered float32 array.
+        
+        Files pyarrow rejects, such as rows with fewer fields than the header,
+        are parsed by the pandas C parser instead. Both parsers treat the same
+        cells as missing. Text columns are converted cell by cell, and a pair
+        using a non-numeric cell is returned as all NaN, so only that spectrum
+        is dropped rather than the whole file.
+        """
+        if pa_csv is not None:
+            try:
+                table = pa_csv.read_csv(
+                    file_path,
+                    read_options=pa_csv.ReadOptions(encoding='latin-1'),
+                    convert_options=pa_csv.ConvertOptions(null_values=_NA_VALUES, strings_can_be_null=True),
+                )
+            except pa.ArrowInvalid:
+                pass  # Ragged rows: the pandas parser pads them with NaN
+            else:
+                columns = [str(name) for name in table.column_names]
+                arr = np.empty((table.num_rows, table.num_columns), dtype=np.float32, order='F')
+                non_numeric = None
+                for i, column in enumerate(table.columns):
+                    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type) \
+                            or pa.types.is_boolean(column.type) or pa.types.is_null(column.type):
+                        arr[:, i] = column.cast(pa.float32(), safe=False).to_numpy()
+                        continue
+                    arr[:, i], bad = _coerce_cells(column.cast(pa.string()).to_pylist())
+                    if bad.any():
+                        if non_numeric is None:
+                            non_numeric = np.zeros(arr.shape, dtype=bool, order='F')
+                        non_numeric[:, i] = bad
+                if non_numeric is not None:
+                    _drop_non_numeric_pairs(file_path, columns, arr, non_numeric)
+                return columns, arr
+        
+        # pandas is only imported when needed, keeping it off the import path
+        import pandas as pd
+        
+        try:
+            # Parsing straight to float32 skips per-column type inference, and
+            # to_numpy then copies the column blocks once into a single array
+            df = pd.read_csv(file_path, encoding='latin-1', engine='c', dtype=np.float32)
+            return [str(name) for name in df.columns], np.asfortranarray(df.to_numpy(dtype=np.float32, copy=False))
+        except ValueError:
+            pass  # A non-numeric cell: parse again and convert column by column
+        
+        df = pd.read_csv(file_path, encoding='latin-1', engine='c', low_memory=False)
+        columns = [str(name) for name in df.columns]
+        arr = np.empty(df.shape, dtype=np.float32, order='F')
+        non_numeric = None
+        for i in range(df.shape[1]):
+            column = df.iloc[:, i]
+            if column.dtype.kind in 'biuf':
+                arr[:, i] = column.to_numpy(dtype=np.float32, na_value=np.nan)
+                continue
+            cells = [None if missing else cell for cell, missing in zip(column.tolist(), column.isna().tolist())]
+            arr[:, i], bad = _coerce_cells(cells)
+            if bad.any():
+                if non_numeric is None:
+                    non_numeric = np.zeros(arr.shape, dtype=bool, order='F')
+                non_numeric[:, i] = bad
+        if non_numeric is not None:
+            _drop_non_numeric_pairs(file_path, columns, arr, non_numeric)
+        return columns, arr
+    
+    def _excitation_wavelengths(self, axis_columns: List[str]) -> Optional[List[Optional[float]]]:
+        """
+        Get the excitation wavelength of each column pair.
+        
+        Args:
+            axis_columns: Names of the wavelength columns, one per pair
+            
+        Returns:
+            One excitation wavelength per pair, or None if not applicable
+        """
+        return None
+    
+    def _shared_axis_mask(self, arr: np.ndarray, nan_mask: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Detect the common layout where all pairs repeat one wavelength axis.
+        
+        Args:
+            arr: 2D array returned by _read_csv
+            nan_mask: np.isnan(arr)
+            
+        Returns:
+            Mask of the rows where the shared axis is defined, or None if
+            the pairs do not share one wavelength column
+        """
+        n_pairs = arr.shape[1] // 2
+        if n_pairs == 0:
+            return None
+        
+        axes = arr[:, 0:2 * n_pairs:2]
+        if not np.array_equal(axes, np.broadcast_to(axes[:, :1], axes.shape), equal_nan=True):
+            return None
+        return ~nan_mask[:, 0]
+    
+    def _to_batch(
+        self,
+        columns: List[str],
+        arr: np.ndarray,
+        nan_mask: np.ndarray,
+        axis_mask: Optional[np.ndarray]
+    ) -> Optional[SpectralBatch]:
+        """
+        Build a SpectralBatch from an array returned by _read_csv.
+        
+        Only possible when every pair repeats the same wavelength column and
+        no intensity column has gaps where that axis is defined; the
+        intensity rows are then views into ``arr``.
+        
+        Args:
+            columns: Column names returned by _read_csv
+            arr: 2D array returned by _read_csv
+            nan_mask: np.isnan(arr)
+            axis_mask: Shared axis rows returned by _shared_axis_mask
+            
+        Returns:
+            SpectralBatch, or None if the file needs per-pair extraction
+        """
+        n_pairs = arr.shape[1] // 2
+        if axis_mask is None or not axis_mask.any() or nan_mask[axis_mask, 1:2 * n_pairs:2].any():
             return None
+        
+        if axis_mask.all():
+            wavelengths = _intern_axis(arr[:, 0])
+            intensities = arr[:, 1:2 * n_pairs:2].T
+        else:
+            wavelengths = _intern_axis(arr[axis_mask, 0])
+            intensities = np.ascontiguousarray(arr[axis_mask, 1:2 * n_pairs:2].T)
+        
+        return SpectralBatch(
+            wavelengths=wavelengths,
+            intensities=intensities,
+            spectroscopy_type=self.spectroscopy_type,
+            excitation_wavelengths=self._excitation_wavelengths(columns[0:2 * n_pairs:2])
+        )
+    
+    def _extract_all_spectra(
+        self,
+        arr: np.ndarray,
+        nan_mask: np.ndarray,
+        axis_mask: Optional[np.ndarray]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Extract every wavelength-intensity column pair from an array.
+        
+        Pairs without any NaN rows are returned as views into ``arr`` rather
+        than copies. When every pair repeats the same wavelength column, the
+        pairs share a single read-only wavelengths array, which is also shared
+        with other files measured on the same grid.
+        
+        Args:
+            arr: 2D array returned by _read_csv
+            nan_mask: np.isnan(arr)
+            axis_mask: Shared axis rows returned by _shared_axis_mask
+            
+        Returns:
+            List of (wavelengths, intensities) tuples with NaN rows removed
+        """
+        n_pairs = arr.shape[1] // 2
+        
+        shared_wavelengths = None
+        if axis_mask is not None:
+            full_axis = bool(axis_mask.all())
+            shared_wavelengths = _intern_axis(arr[:, 0] if full_axis else arr[axis_mask, 0])
+            # Intensity columns without gaps where the shared axis is defined
+            complete = ~nan_mask[axis_mask, 1:2 * n_pairs:2].any(axis=0)
+        
+        pairs = []
+        for k in range(n_pairs):
+            i = 2 * k
+            if shared_wavelengths is not None and complete[k]:
+                intensities = arr[:, i + 1] if full_axis else arr[axis_mask, i + 1]
+                pairs.append((shared_wavelengths, intensities))
+                continue
+            
+            valid_mask = ~(nan_mask[:, i] | nan_mask[:, i + 1])
+            if valid_mask.all():
+                pairs.append((arr[:, i], arr[:, i + 1]))
+            else:
+                pairs.append((arr[valid_mask, i], arr[valid_mask, i + 1]))
+        
+        return pairs
+    
+    def _build_spectral_data(
+        self,
+        pairs: List[Tuple[np.ndarray, np.ndarray]],
+        build: Callable[[int, np.ndarray, np.ndarray], SpectralData]
+    ) -> List[SpectralData]:
+        """
+        Build SpectralData objects for all non-empty column pairs.
+        
+        The common path has no per-pair exception handling. Only if building
+        fails are the pairs retried one by one, reporting and skipping bad ones.
+        
+        Args:
+            pairs: Column pairs returned by _extract_all_spectra
+            build: Callable taking (pair index, wavelengths, intensities)
+            
+        Returns:
+            List of SpectralData objects
+        """
+        try:
+            return [
+                build(k, wavelengths, intensities)
+                for k, (wavelengths, intensities) in enumerate(pairs)
+                if len(wavelengths) > 0
+            ]
+        except Exception:
+            pass
+        
+        spectral_data_list = []
+        for k, (wavelengths, intensities) in enumerate(pairs):
+            if len(wavelengths) == 0:
+                continue
+            try:
+                spectral_data_list.append(build(k, wavelengths, intensities))
+            except Exception:
+                logger.exception("Error extracting spectrum from columns %d-%d", 2 * k, 2 * k + 1)
+        
+        return spectral_data_list
+    
+    def _warn_wavelength_range(self, wavelength_ranges: List[Tuple[float, float]], low: float, high: float) -> None:
+        """
+        Log one warning listing every wavelength range outside (low, high).
+        
+        Validation checks report once per file rather than once per spectrum.
+        
+        Args:
+            wavelength_ranges: Per-spectrum ranges from _summarize_spectra
+            low: Lowest expected wavelength in nm
+            high: Highest expected wavelength in nm
+        """
+        out_of_range = [r for r in wavelength_ranges if r[0] < low or r[1] > high]
+        if out_of_range:
+            logger.warning(
+                "Wavelength ranges %s outside expected %s range", out_of_range, self.spectroscopy_type.value
+            )
+    
+    def _summarize_spectra(
+        self, spectral_data: List[SpectralData]
+    ) -> Tuple[List[Tuple[float, float]], np.ndarray, np.ndarray]:
+        """
+        Compute per-spectrum validation statistics.
+        
+        Spectra of equal length are stacked and reduced in a single pass;
+        otherwise each spectrum is reduced on its own.
+        
+        Args:
+            spectral_data: List of spectral data to summarize
+            
+        Returns:
+            Tuple of (wavelength ranges, has-negative flags, has-NaN flags)
+        """
+        if len({data.data_points for data in spectral_data}) == 1:
+            wavelengths = np.stack([data.wavelengths for data in spectral_data])
+            intensities = np.stack([data.intensities for data in spectral_data])
+            wavelength_ranges = list(zip(wavelengths.min(axis=1).tolist(), wavelengths.max(axis=1).tolist()))
+            return wavelength_ranges, (intensities < 0).any(axis=1), np.isnan(intensities).any(axis=1)
+        
+        wavelength_ranges = [data.wavelength_range for data in spectral_data]
+        has_negative = np.array([np.any(data.intensities < 0) for data in spectral_data])
+        has_nan = np.array([np.any(np.isnan(data.intensities)) for data in spectral_data])
+        return wavelength_ranges, has_negative, has_nan
     
     def _extract_aging_step(self, file_path: Path) -> AgingStep:
         """Extract aging step from file path."""
-        filename = file_path.name
-        if "AS0" in filename:
-            return AgingStep.STEP_0
-        elif "AS1" in filename:
-            return AgingStep.STEP_1
-        elif "AS2" in filename:
-            return AgingStep.STEP_2
-        elif "AS3" in filename:
-            return AgingStep.STEP_3
-        elif "AS4" in filename:
-            return AgingStep.STEP_4
-        elif "AS5" in filename:
-            return AgingStep.STEP_5
-        elif "AS6" in filename:
-            return AgingStep.STEP_6
-        elif "AS7" in filename:
-            return AgingStep.STEP_7
-        elif "AS8" in filename:
-            return AgingStep.STEP_8
-        elif "AS9" in filename:
-            return AgingStep.STEP_9
-        else:
-            return AgingStep.STEP_0  # Default
+        return _aging_step_from_name(file_path.name)
     
     def _extract_sample_id(self, file_path: Path) -> str:
         """Extract sample ID from file path."""
@@ -2,10 +2,12 @@
 Factory pattern for creating spectroscopy data sources.
 """
 
-from typing import Dict, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
 from pathlib import Path
 
-from hyrcania.domain.models.spectrum import SpectroscopyType
+from hyrcania.domain.models.spectrum import SpectralData, SpectroscopyType
+from hyrcania.domain.models.measurement import Measurement
 from .fluorescence import FluorescenceStrategy
 from .absorption import AbsorptionStrategy
 
@@ -18,6 +20,9 @@ class SpectroscopyDataSourceFactory:
         SpectroscopyType.ABSORPTION: AbsorptionStrategy,
     }
     
+    # Strategies are stateless, so one shared instance per type is enough
+    _instances: Dict[SpectroscopyType, Any] = {}
+    
     @classmethod
     def create_strategy(cls, spectroscopy_type: SpectroscopyType):
         """
@@ -27,13 +32,17 @@ class SpectroscopyDataSourceFactory:
             spectroscopy_type: Type of spectroscopy
             
         Returns:
-            Spectroscopy strategy instance
+            Spectroscopy strategy instance, shared between calls
         """
+        strategy = cls._instances.get(spectroscopy_type)
+        if strategy is not None:
+            return strategy
+        
         if spectroscopy_type not in cls._strategies:
             raise ValueError(f"Unsupported spectroscopy type: {spectroscopy_type}")
         
         strategy_class = cls._strategies[spectroscopy_type]
-        return strategy_class()
+        return cls._instances.setdefault(spectroscopy_type, strategy_class())
     
     @classmethod
     def create_strategy_from_file(cls, file_path: Path):
@@ -55,6 +64,69 @@ class SpectroscopyDataSourceFactory:
             # Default to fluorescence for now
             return cls.create_strategy(SpectroscopyType.FLUORESCENCE)
     
+    @staticmethod
+    def iter_data_files(data_dir: Path, spectroscopy_type: SpectroscopyType) -> Iterator[Path]:
+        """
+        Lazily find the CSV files of one spectroscopy type under a directory.
+        
+        Files are expected in folders named after the type, e.g.
+        ``<sample>/Fluorescence/*.csv``. The generator can be passed straight
+        to load_many so loading starts while the search is still running.
+        
+        Args:
+            data_dir: Root directory to search
+            spectroscopy_type: Type of spectroscopy
+            
+        Returns:
+            Iterator over matching file paths
+        """
+        return data_dir.rglob(f"{spectroscopy_type.value.capitalize()}/*.csv")
+    
+    @classmethod
+    def load_many(cls, file_paths: Iterable[Path], max_workers: Optional[int] = None) -> List[Optional[Measurement]]:
+        """
+        Load measurements from many files in parallel.
+        
+        Files are loaded on a thread pool; the CSV parsers release the GIL
+        while parsing, so threads overlap both I/O and parsing.
+        
+        Args:
+            file_paths: Paths to the spectroscopy data files
+            max_workers: Maximum number of worker threads (defaults to the executor's choice)
+            
+        Returns:
+            Measurements in input order, None for files that failed to load
+        """
+        def load(file_path: Path) -> Optional[Measurement]:
+            return cls.create_strategy_from_file(file_path).create_measurement(file_path)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load, file_paths))
+    
+    @classmethod
+    def load_many_data(
+        cls,
+        file_paths: Iterable[Path],
+        spectroscopy_type: SpectroscopyType,
+        max_workers: Optional[int] = None
+    ) -> List[List[SpectralData]]:
+        """
+        Load spectral data from many files of one type in parallel.
+        
+        All files share the single strategy instance for the type.
+        
+        Args:
+            file_paths: Paths to the spectroscopy data files
+            spectroscopy_type: Type of spectroscopy
+            max_workers: Maximum number of worker threads (defaults to the executor's choice)
+            
+        Returns:
+            One list of SpectralData objects per file, in input order
+        """
+        strategy = cls.create_strategy(spectroscopy_type)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(strategy.load_data, file_paths))
+    
     @classmethod
     def register_strategy(cls, spectroscopy_type: SpectroscopyType, strategy_class: Type):
         """
@@ -64,4 +136,5 @@ class SpectroscopyDataSourceFactory:
             spectroscopy_type: Type of spectroscopy
             strategy_class: Strategy class to register
         """
-        cls._strategies[spectroscopy_type] = strategy_class 
\ No newline at end of file
+        cls._strategies[spectroscopy_type] = strategy_class
+        cls._instances.pop(spectroscopy_type, None) 
\ No newline at end of file
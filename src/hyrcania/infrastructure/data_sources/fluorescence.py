@@ -2,15 +2,34 @@
 Fluorescence spectroscopy data loading strategy.
 """
 
-from typing import List, Dict, Any, Tuple
+import logging
+import re
+from functools import lru_cache
+from typing import List, Dict, Any
 from pathlib import Path
-import pandas as pd
-import numpy as np
 from datetime import datetime
 
 from hyrcania.infrastructure.data_sources.base import SpectroscopyStrategy
 from hyrcania.domain.models.spectrum import SpectralData, SpectroscopyType
 
+logger = logging.getLogger(__name__)
+
+# Text between the first "EX_" of a column name and the next "EX_" or the end
+_EXCITATION_RE = re.compile(r'EX_(.*?)(?=EX_|\Z)', re.DOTALL)
+_DEFAULT_EXCITATION_WAVELENGTH = 300.0
+
+
+@lru_cache(maxsize=4096)
+def _excitation_from_column(column_name: str) -> float:
+    """Parse the excitation wavelength from a column name such as "N0_EX_300.00"."""
+    match = _EXCITATION_RE.search(column_name)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return _DEFAULT_EXCITATION_WAVELENGTH
+
 
 class FluorescenceStrategy(SpectroscopyStrategy):
     """Strategy for loading fluorescence spectroscopy data."""
@@ -18,43 +37,6 @@ class FluorescenceStrategy(SpectroscopyStrategy):
     def __init__(self):
         super().__init__(SpectroscopyType.FLUORESCENCE)
     
-    def load_data(self, file_path: Path) -> List[SpectralData]:
-        """
-        Load fluorescence spectral data from a CSV file.
-        
-        Args:
-            file_path: Path to the fluorescence CSV file
-            
-        Returns:
-            List of SpectralData objects
-        """
-        try:
-            df = pd.read_csv(file_path, encoding='latin-1', low_memory=False)
-            spectral_data_list = []
-            
-            # Extract all wavelength-intensity pairs (every 2 columns)
-            for i in range(0, df.shape[1] - 1, 2):
-                try:
-                    wavelengths, intensities = self._extract_spectrum(df, i)
-                    if len(wavelengths) > 0:
-                        spectral_data = SpectralData(
-                            wavelengths=wavelengths,
-                            intensities=intensities,
-                            spectroscopy_type=SpectroscopyType.FLUORESCENCE,
-                            excitation_wavelength=self._extract_excitation_wavelength(str(df.columns[i])),
-                            emission_wavelength=None  # Will be calculated from wavelengths
-                        )
-                        spectral_data_list.append(spectral_data)
-                except Exception as e:
-                    print(f"Error extracting spectrum from columns {i}-{i+1}: {e}")
-                    continue
-                    
-            return spectral_data_list
-            
-        except Exception as e:
-            print(f"Error loading fluorescence file {file_path}: {e}")
-            return []
-    
     def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
         Extract metadata from fluorescence file path.
@@ -97,45 +79,24 @@ class FluorescenceStrategy(SpectroscopyStrategy):
         if not spectral_data:
             return False
         
-        for data in spectral_data:
-            # Check wavelength range (fluorescence typically 300-800 nm)
-            if data.wavelength_range[0] < 200 or data.wavelength_range[1] > 1000:
-                print(f"Warning: Wavelength range {data.wavelength_range} outside expected fluorescence range")
-            
-            # Check for negative intensities
-            if np.any(data.intensities < 0):
-                print(f"Warning: Negative intensities found in fluorescence data")
-            
-            # Check for NaN values
-            if np.any(np.isnan(data.intensities)):
-                print(f"Warning: NaN values found in fluorescence data")
+        wavelength_ranges, has_negative, has_nan = self._summarize_spectra(spectral_data)
         
-        return True
-    
-    def _extract_spectrum(self, df: pd.DataFrame, col_idx: int) -> Tuple[np.ndarray, np.ndarray]:
-        """
-        Extract wavelength-intensity pair from dataframe columns.
+        # Check wavelength range (fluorescence typically 300-800 nm)
+        self._warn_wavelength_range(wavelength_ranges, 200, 1000)
         
-        Args:
-            df: DataFrame containing spectral data
-            col_idx: Starting column index for wavelength column
-            
-        Returns:
-            Tuple of (wavelengths, intensities)
-        """
-        if col_idx + 1 >= df.shape[1]:
-            raise ValueError(f"Column index {col_idx} out of bounds")
-        
-        # Get wavelength and intensity columns
-        wavelength_col = df.iloc[:, col_idx]
-        intensity_col = df.iloc[:, col_idx + 1]
+        # Check for negative intensities
+        if has_negative.any():
+            logger.warning("Negative intensities found in %d fluorescence spectra", has_negative.sum())
         
-        # Remove rows with NaN values
-        valid_mask = ~(wavelength_col.isna() | intensity_col.isna())
-        wavelengths = wavelength_col[valid_mask].values.astype(float)
-        intensities = intensity_col[valid_mask].values.astype(float)
+        # Check for NaN values
+        if has_nan.any():
+            logger.warning("NaN values found in %d fluorescence spectra", has_nan.sum())
         
-        return wavelengths, intensities
+        return True
+    
+    def _excitation_wavelengths(self, axis_columns: List[str]) -> List[float]:
+        """Parse the excitation wavelength of each column pair from its wavelength column name."""
+        return [_excitation_from_column(name) for name in axis_columns]
     
     def _extract_excitation_wavelength(self, column_name: str) -> float:
         """
@@ -147,13 +108,4 @@ class FluorescenceStrategy(SpectroscopyStrategy):
         Returns:
             Excitation wavelength in nm
         """
-        try:
-            # Example column name: "N0_EX_300.00"
-            if 'EX_' in column_name:
-                parts = column_name.split('EX_')
-                if len(parts) > 1:
-                    return float(parts[1])
-        except (ValueError, IndexError):
-            pass
-        
-        return 300.0  # Default excitation wavelength 
\ No newline at end of file
+        return _excitation_from_column(column_name)
\ No newline at end of file
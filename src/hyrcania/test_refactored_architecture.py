@@ -1,208 +1,618 @@
 #!/usr/bin/env python3
 """
-Test script to demonstrate the refactored Hyrcania architecture.
-Shows the new design patterns in action.
+Tests for the refactored Hyrcania architecture.
+Exercises the new design patterns; run with ``pytest`` (``pytest -n auto`` with pytest-xdist).
 """
 
+import os
 import sys
 from pathlib import Path
-import numpy as np
+import pytest
 
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def test_domain_models():
+# numpy and the hyrcania modules are imported inside the fixtures and tests
+# that use them, so an import failure is reported against those tests only
+
+
+@pytest.fixture(scope="module")
+def rng():
+    """Seeded generator shared by all tests so their inputs are reproducible."""
+    import numpy as np
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def wavelengths():
+    """Wavelength grid shared by all test spectra instead of being rebuilt per test."""
+    import numpy as np
+    grid = np.linspace(300, 800, 251, dtype=np.float32)
+    grid.flags.writeable = False
+    return grid
+
+
+@pytest.fixture(scope="module")
+def intensities(rng):
+    import numpy as np
+    return rng.random(251, dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def spectral_data(wavelengths, intensities):
+    from hyrcania.domain.models.spectrum import SpectralData, SpectroscopyType
+    return SpectralData(
+        wavelengths=wavelengths,
+        intensities=intensities,
+        spectroscopy_type=SpectroscopyType.FLUORESCENCE,
+        excitation_wavelength=300.0
+    )
+
+
+@pytest.fixture(scope="module")
+def strategy():
+    from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
+    from hyrcania.domain.models.spectrum import SpectroscopyType
+    return SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.FLUORESCENCE)
+
+
+def test_domain_models(spectral_data, wavelengths):
     """Test the new domain models."""
-    print("🧪 Testing Domain Models")
-    print("=" * 50)
+    import numpy as np
+    from hyrcania.domain.models.spectrum import SpectralData, SpectralBatch, Spectrum
+    from hyrcania.domain.models.quality import QualityMetrics, QualityGrade
     
-    try:
-        from hyrcania.domain.models.spectrum import SpectralData, SpectroscopyType, Spectrum
-        from hyrcania.domain.models.measurement import Measurement, AgingStep
-        from hyrcania.domain.models.quality import QualityMetrics, QualityGrade
-        
-        # Test SpectralData
-        wavelengths = np.linspace(300, 800, 251)
-        intensities = np.random.random(251)
-        
-        spectral_data = SpectralData(
-            wavelengths=wavelengths,
-            intensities=intensities,
-            spectroscopy_type=SpectroscopyType.FLUORESCENCE,
-            excitation_wavelength=300.0
-        )
-        
-        print(f"✅ Created SpectralData:")
-        print(f"   Wavelength range: {spectral_data.wavelength_range}")
-        print(f"   Intensity range: {spectral_data.intensity_range}")
-        print(f"   Data points: {spectral_data.data_points}")
-        
-        # Test Spectrum
-        spectrum = Spectrum(
-            spectral_data=spectral_data,
-            measurement_name="test_spectrum",
-            aging_step=0,
-            sample_id="test_sample"
-        )
-        
-        print(f"✅ Created Spectrum:")
-        print(f"   Measurement name: {spectrum.measurement_name}")
-        print(f"   Aging step: {spectrum.aging_step}")
-        
-        # Test QualityMetrics
-        quality_metrics = QualityMetrics(
-            acidity=0.5,
-            peroxide_value=15.0,
-            k232=2.0,
-            k270=0.15
-        )
-        
-        overall_score = quality_metrics.calculate_overall_score()
-        quality_grade = quality_metrics.determine_quality_grade()
-        
-        print(f"✅ Created QualityMetrics:")
-        print(f"   Overall score: {overall_score:.2f}")
-        print(f"   Quality grade: {quality_grade.value}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Domain models test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test SpectralData
+    assert spectral_data.wavelength_range == (300.0, 800.0)
+    assert spectral_data.data_points == 251
+    assert spectral_data.intensities.dtype == np.float32
+    assert spectral_data.wavelengths is wavelengths
+    
+    normalized = SpectralData.normalize_batch([spectral_data, spectral_data])
+    assert len(normalized) == 2
+    assert normalized[0].intensity_range == pytest.approx((0.0, 1.0))
+    
+    batch = SpectralBatch.from_list([spectral_data, spectral_data])
+    assert batch.intensities.shape == (2, 251)
+    assert len(batch.mean_spectrum()) == 251
+    
+    blocks = batch.blocked()
+    assert blocks.shape == (1, 251, 16)
+    np.testing.assert_allclose(batch.mean_over_samples(blocks), batch.mean_spectrum(), rtol=1e-6)
+    
+    # Test Spectrum
+    spectrum = Spectrum(
+        spectral_data=spectral_data,
+        measurement_name="test_spectrum",
+        aging_step=0,
+        sample_id="test_sample"
+    )
+    
+    assert spectrum.measurement_name == "test_spectrum"
+    assert spectrum.aging_step == 0
+    assert spectrum.wavelengths is wavelengths
+    
+    # Test QualityMetrics
+    quality_metrics = QualityMetrics(
+        acidity=0.5,
+        peroxide_value=15.0,
+        k232=2.0,
+        k270=0.15
+    )
+    
+    assert 0.0 <= quality_metrics.calculate_overall_score() <= 100.0
+    assert isinstance(quality_metrics.determine_quality_grade(), QualityGrade)
+
+
+def test_normalize_keeps_dtype(wavelengths, intensities):
+    """Spectra built with dtype=None keep their dtype through normalization and batching."""
+    import numpy as np
+    from hyrcania.domain.models.spectrum import SpectralData, SpectralBatch, SpectroscopyType
+    
+    data = SpectralData(
+        wavelengths=wavelengths.astype(np.float64),
+        intensities=intensities.astype(np.float64),
+        spectroscopy_type=SpectroscopyType.FLUORESCENCE,
+        dtype=None
+    )
+    assert data.intensities.dtype == np.float64
+    assert data.normalize().intensities.dtype == np.float64
+    assert all(d.intensities.dtype == np.float64 for d in SpectralData.normalize_batch([data, data]))
+    
+    batch = SpectralBatch.from_list([data, data])
+    assert batch.intensities.dtype == np.float64
+    assert batch.normalize().intensities.dtype == np.float64
+    assert all(d.intensities.dtype == np.float64 for d in batch.to_spectral_data())
+
+
+@pytest.mark.parametrize("kernel", ["numba", "numpy"])
+@pytest.mark.parametrize("n_rows", [3, 1026])
+def test_normalize_nan_and_constant_rows(kernel, n_rows, wavelengths, intensities, monkeypatch):
+    """Min-max normalization matches the NumPy formula on NaN and constant rows."""
+    import numpy as np
+    from hyrcania.domain.models import _kernels
+    from hyrcania.domain.models.spectrum import SpectralData, SpectralBatch, SpectroscopyType
+    if kernel == "numba" and _kernels.njit is None:
+        pytest.skip("numba is not installed")
+    if kernel == "numpy":
+        monkeypatch.setattr(_kernels, 'njit', None)
+    
+    with_nan = intensities.copy()
+    with_nan[100] = np.nan
+    rows = np.stack([intensities, with_nan, np.full_like(intensities, 2.0)])
+    rows = np.tile(rows, (n_rows // 3, 1))
+    with np.errstate(invalid='ignore'):
+        lo = rows.min(axis=1, keepdims=True)
+        expected = (rows - lo) / (rows.max(axis=1, keepdims=True) - lo)
+    assert np.isnan(expected[1]).all() and np.isnan(expected[2]).all()
+    
+    batch = SpectralBatch(wavelengths, rows, SpectroscopyType.FLUORESCENCE)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        np.testing.assert_allclose(batch.normalize().intensities, expected, rtol=1e-6)
+        spectra = SpectralData.normalize_batch(batch.to_spectral_data())
+    np.testing.assert_allclose(np.stack([data.intensities for data in spectra]), expected, rtol=1e-6)
 
 
 def test_strategy_pattern():
     """Test the strategy pattern for data loading."""
-    print("\n🧪 Testing Strategy Pattern")
-    print("=" * 50)
+    from hyrcania.infrastructure.data_sources.fluorescence import FluorescenceStrategy
+    from hyrcania.infrastructure.data_sources.absorption import AbsorptionStrategy
+    from hyrcania.domain.models.spectrum import SpectroscopyType
     
-    try:
-        from hyrcania.infrastructure.data_sources.fluorescence import FluorescenceStrategy
-        from hyrcania.infrastructure.data_sources.absorption import AbsorptionStrategy
-        
-        # Test fluorescence strategy
-        fluorescence_strategy = FluorescenceStrategy()
-        print(f"✅ Created FluorescenceStrategy: {fluorescence_strategy.spectroscopy_type.value}")
-        
-        # Test absorption strategy
-        absorption_strategy = AbsorptionStrategy()
-        print(f"✅ Created AbsorptionStrategy: {absorption_strategy.spectroscopy_type.value}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Strategy pattern test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    assert FluorescenceStrategy().spectroscopy_type is SpectroscopyType.FLUORESCENCE
+    assert AbsorptionStrategy().spectroscopy_type is SpectroscopyType.ABSORPTION
 
 
-def test_factory_pattern():
+@pytest.mark.parametrize("name, step", [
+    ("S1_AS2.csv", 2),
+    ("x_AS3_AS1.csv", 1),
+    ("S1.csv", 0),
+])
+def test_aging_step_from_file_name(strategy, name, step):
+    """The lowest ASn tag in a file name is its aging step, STEP_0 without one."""
+    from hyrcania.domain.models.measurement import AgingStep
+    
+    assert strategy._extract_aging_step(Path("S1") / name) is AgingStep(step)
+
+
+def test_factory_pattern(strategy):
     """Test the factory pattern."""
-    print("\n🧪 Testing Factory Pattern")
-    print("=" * 50)
+    from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
+    from hyrcania.infrastructure.data_sources.fluorescence import FluorescenceStrategy
+    from hyrcania.infrastructure.data_sources.absorption import AbsorptionStrategy
+    from hyrcania.domain.models.spectrum import SpectroscopyType
     
-    try:
-        from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
-        from hyrcania.domain.models.spectrum import SpectroscopyType
-        
-        # Test factory creation
-        fluorescence_strategy = SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.FLUORESCENCE)
-        print(f"✅ Factory created FluorescenceStrategy: {fluorescence_strategy.spectroscopy_type.value}")
-        
-        absorption_strategy = SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.ABSORPTION)
-        print(f"✅ Factory created AbsorptionStrategy: {absorption_strategy.spectroscopy_type.value}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Factory pattern test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    assert isinstance(strategy, FluorescenceStrategy)
+    assert SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.FLUORESCENCE) is strategy
+    
+    absorption_strategy = SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.ABSORPTION)
+    assert isinstance(absorption_strategy, AbsorptionStrategy)
 
 
-def test_data_loading():
+def test_data_loading(strategy):
     """Test data loading with the new architecture."""
-    print("\n🧪 Testing Data Loading")
-    print("=" * 50)
+    from itertools import islice
+    from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
+    from hyrcania.domain.models.spectrum import SpectroscopyType
     
+    # Find up to two fluorescence files, stopping early
+    data_dir = Path("data/extracted")
+    fluorescence_files = list(islice(
+        SpectroscopyDataSourceFactory.iter_data_files(data_dir, SpectroscopyType.FLUORESCENCE), 2
+    ))
+    
+    if not fluorescence_files:
+        pytest.skip("No fluorescence files found")
+    
+    spectral_data_list = strategy.load_data(fluorescence_files[0])
+    assert spectral_data_list
+    assert all(data.spectroscopy_type is SpectroscopyType.FLUORESCENCE for data in spectral_data_list)
+    
+    # Load several files in parallel
+    results = SpectroscopyDataSourceFactory.load_many_data(fluorescence_files, SpectroscopyType.FLUORESCENCE)
+    assert len(results) == len(fluorescence_files)
+    assert len(results[0]) == len(spectral_data_list)
+    
+    # Files on one shared wavelength axis load as a single batch
     try:
-        from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
-        from hyrcania.domain.models.spectrum import SpectroscopyType
-        
-        # Find a fluorescence file
-        data_dir = Path("data/extracted")
-        fluorescence_files = list(data_dir.rglob("**/Fluorescence/*.csv"))
-        
-        if not fluorescence_files:
-            print("❌ No fluorescence files found")
-            return False
-        
-        test_file = fluorescence_files[0]
-        print(f"📁 Testing with file: {test_file.name}")
-        
-        # Create strategy and load data
-        strategy = SpectroscopyDataSourceFactory.create_strategy(SpectroscopyType.FLUORESCENCE)
-        spectral_data_list = strategy.load_data(test_file)
-        
-        print(f"✅ Loaded {len(spectral_data_list)} spectral data objects")
-        
-        if spectral_data_list:
-            first_data = spectral_data_list[0]
-            print(f"   First spectrum: {first_data.wavelength_range} nm, {first_data.data_points} points")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Data loading test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("🚀 Testing Refactored Hyrcania Architecture")
-    print("=" * 60)
-    
-    tests = [
-        ("Domain Models", test_domain_models),
-        ("Strategy Pattern", test_strategy_pattern),
-        ("Factory Pattern", test_factory_pattern),
-        ("Data Loading", test_data_loading),
+        batch = strategy.load_batch(fluorescence_files[0])
+    except ValueError:
+        return
+    assert batch.intensities.shape[0] == len(spectral_data_list)
+    assert all(data.wavelengths is batch.wavelengths for data in spectral_data_list)
+
+
+# Small CSV files covering the layouts the loaders must handle
+_SHARED_AXIS_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1,N2_EX_320.00,I2\n"
+    "300,1.0,300,2.0,300,3.0\n"
+    "301,1.5,301,2.5,301,3.5\n"
+    "302,2.0,302,3.0,302,4.0\n"
+)
+_SHORT_ROWS_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1.0,300,2.0\n"
+    "301,1.5\n"
+    "302,2.0,302,3.0\n"
+)
+_RAGGED_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1.0,300,2.0\n"
+    "301,1.5,,\n"
+    "302,2.0,302,\n"
+)
+_TEXT_CELL_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1.0,300,2.0\n"
+    "301,bad,301,2.5\n"
+    "302,2.0,302,3.0\n"
+)
+_NULL_TOKENS_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1.0,300,2.0\n"
+    "301,None,301,2.5\n"
+    "302,2.0,302,<NA>\n"
+)
+_MASKED_TEXT_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1.0,300,2.0\n"
+    ",bad,301,2.5\n"
+    "302,2.0,302,3.0\n"
+)
+_LARGE_INTEGER_CSV = (
+    "N0_EX_300.00,I0,N1_EX_310.00,I1\n"
+    "300,1,300,2.0\n"
+    "301,16777217,301,2.5\n"
+)
+
+
+def _write_csv(directory, name, text):
+    path = directory / name
+    path.write_text(text, encoding='latin-1')
+    return path
+
+
+def _as_tuples(spectral_data_list):
+    return [
+        (data.excitation_wavelength, data.wavelengths.tolist(), data.intensities.tolist())
+        for data in spectral_data_list
+    ]
+
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def parser(request, monkeypatch):
+    """Run a test once with the pyarrow CSV reader and once with the pandas fallback."""
+    from hyrcania.infrastructure.data_sources import base
+    if request.param == "pyarrow" and base.pa_csv is None:
+        pytest.skip("pyarrow is not installed")
+    if request.param == "pandas":
+        monkeypatch.setattr(base, 'pa_csv', None)
+    return request.param
+
+
+def test_load_shared_axis(tmp_path, strategy, parser):
+    """Spectra on one wavelength axis load as a batch and share that axis."""
+    path = _write_csv(tmp_path, "shared_AS1.csv", _SHARED_AXIS_CSV)
+    
+    spectral_data_list = strategy.load_data(path)
+    assert _as_tuples(spectral_data_list) == [
+        (300.0, [300.0, 301.0, 302.0], [1.0, 1.5, 2.0]),
+        (310.0, [300.0, 301.0, 302.0], [2.0, 2.5, 3.0]),
+        (320.0, [300.0, 301.0, 302.0], [3.0, 3.5, 4.0]),
+    ]
+    assert all(data.wavelengths is spectral_data_list[0].wavelengths for data in spectral_data_list)
+    
+    batch = strategy.load_batch(path)
+    assert batch.intensities.shape == (3, 3)
+    assert batch.excitation_wavelengths == [300.0, 310.0, 320.0]
+
+
+def test_load_short_and_ragged_rows(tmp_path, strategy, parser):
+    """Missing trailing fields and empty cells only shorten the affected spectra."""
+    short = _write_csv(tmp_path, "short_AS1.csv", _SHORT_ROWS_CSV)
+    assert _as_tuples(strategy.load_data(short)) == [
+        (300.0, [300.0, 301.0, 302.0], [1.0, 1.5, 2.0]),
+        (310.0, [300.0, 302.0], [2.0, 3.0]),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results.append((test_name, False))
+    ragged = _write_csv(tmp_path, "ragged_AS1.csv", _RAGGED_CSV)
+    assert _as_tuples(strategy.load_data(ragged)) == [
+        (300.0, [300.0, 301.0, 302.0], [1.0, 1.5, 2.0]),
+        (310.0, [300.0], [2.0]),
+    ]
+    with pytest.raises(ValueError):
+        strategy.load_batch(ragged)
+
+
+def test_load_non_numeric_cell(tmp_path, strategy, parser):
+    """A text cell drops only the spectrum whose column holds it."""
+    path = _write_csv(tmp_path, "text_AS1.csv", _TEXT_CELL_CSV)
+    
+    assert _as_tuples(strategy.load_data(path)) == [
+        (310.0, [300.0, 301.0, 302.0], [2.0, 2.5, 3.0]),
+    ]
+    
+    measurement = strategy.create_measurement(path)
+    assert measurement is not None
+    assert measurement.spectrum_count == 1
+
+
+def test_load_null_tokens_and_masked_text(tmp_path, strategy, parser):
+    """None and <NA> are missing cells, and text in a row the pair drops is ignored."""
+    path = _write_csv(tmp_path, "null_AS1.csv", _NULL_TOKENS_CSV)
+    assert _as_tuples(strategy.load_data(path)) == [
+        (300.0, [300.0, 302.0], [1.0, 2.0]),
+        (310.0, [300.0, 301.0], [2.0, 2.5]),
+    ]
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("📋 TEST SUMMARY")
-    print("=" * 60)
+    path = _write_csv(tmp_path, "masked_AS1.csv", _MASKED_TEXT_CSV)
+    assert _as_tuples(strategy.load_data(path)) == [
+        (300.0, [300.0, 302.0], [1.0, 2.0]),
+        (310.0, [300.0, 301.0, 302.0], [2.0, 2.5, 3.0]),
+    ]
+
+
+def test_load_large_integer(tmp_path, strategy, parser):
+    """Integers beyond float32 precision are rounded, not rejected."""
+    path = _write_csv(tmp_path, "large_AS1.csv", _LARGE_INTEGER_CSV)
+    
+    spectral_data_list = strategy.load_data(path)
+    assert len(spectral_data_list) == 2
+    assert spectral_data_list[0].intensities.tolist() == [1.0, 16777216.0]
+
+
+def test_parsers_agree(tmp_path, strategy, monkeypatch):
+    """The pyarrow reader and the pandas fallback load every layout identically."""
+    from hyrcania.infrastructure.data_sources import base
+    if base.pa_csv is None:
+        pytest.skip("pyarrow is not installed")
+    
+    texts = [
+        _SHARED_AXIS_CSV, _SHORT_ROWS_CSV, _RAGGED_CSV, _TEXT_CELL_CSV,
+        _NULL_TOKENS_CSV, _MASKED_TEXT_CSV, _LARGE_INTEGER_CSV,
+    ]
+    for i, text in enumerate(texts):
+        path = _write_csv(tmp_path, f"file{i}_AS1.csv", text)
+        with_pyarrow = _as_tuples(strategy.load_data(path))
+        with monkeypatch.context() as patch:
+            patch.setattr(base, 'pa_csv', None)
+            with_pandas = _as_tuples(strategy.load_data(path))
+        assert with_pyarrow == with_pandas
+
+
+def test_csv_cache_round_trip(tmp_path, strategy, monkeypatch):
+    """HYRCANIA_CSV_CACHE writes a <name>.csv.npy sidecar and reuses it when it matches."""
+    import numpy as np
+    from hyrcania.infrastructure.data_sources import base
+    monkeypatch.setattr(base, '_CSV_CACHE', True)
+    
+    path = _write_csv(tmp_path, "cached_AS1.csv", _SHARED_AXIS_CSV)
+    # An unrelated file sharing the CSV's stem must never be read as a cache
+    np.save(tmp_path / "cached_AS1.npy", np.zeros((3, 3)))
+    
+    expected = _as_tuples(strategy.load_data(path))
+    cache_path = tmp_path / "cached_AS1.csv.npy"
+    assert cache_path.exists()
+    
+    columns, arr = strategy._read_csv(path)
+    assert isinstance(arr, np.memmap)
+    assert arr.shape == (3, len(columns))
+    assert _as_tuples(strategy.load_data(path)) == expected
+    
+    # A cached array that does not match the header is ignored and rewritten
+    np.save(cache_path, np.zeros((3, 2), dtype=np.float32))
+    assert _as_tuples(strategy.load_data(path)) == expected
+    assert np.load(cache_path).shape == (3, 6)
+
+
+_ABSORPTION_CSV = (
+    "W0,A0,W1,A1\n"
+    "250,0.1,250,0.2\n"
+    "251,0.3,251,0.4\n"
+)
+
+
+def test_load_many(tmp_path):
+    """Files load in input order, dispatched on their folder, with None for failures."""
+    from hyrcania.infrastructure.data_sources.factory import SpectroscopyDataSourceFactory
+    from hyrcania.domain.models.spectrum import SpectroscopyType
     
-    passed = 0
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if result:
-            passed += 1
+    fluorescence_dir = tmp_path / "S1" / "Fluorescence"
+    absorption_dir = tmp_path / "S1" / "Absorption"
+    fluorescence_dir.mkdir(parents=True)
+    absorption_dir.mkdir(parents=True)
+    fluorescence = _write_csv(fluorescence_dir, "S1_AS1.csv", _SHARED_AXIS_CSV)
+    empty = _write_csv(fluorescence_dir, "S1_AS2.csv", "N0_EX_300.00,I0\n")
+    absorption = _write_csv(absorption_dir, "S1_AS1.csv", _ABSORPTION_CSV)
     
-    print(f"\nOverall: {passed}/{len(results)} tests passed")
+    found = SpectroscopyDataSourceFactory.iter_data_files(tmp_path, SpectroscopyType.FLUORESCENCE)
+    assert sorted(found) == [fluorescence, empty]
+    assert list(SpectroscopyDataSourceFactory.iter_data_files(tmp_path, SpectroscopyType.ABSORPTION)) == [absorption]
     
-    if passed == len(results):
-        print("🎉 All tests passed! The refactored architecture is working.")
-    else:
-        print("⚠️  Some tests failed. Check the output above for details.")
+    measurements = SpectroscopyDataSourceFactory.load_many([absorption, empty, fluorescence], max_workers=2)
+    assert measurements[1] is None
+    assert measurements[0].spectroscopy_type is SpectroscopyType.ABSORPTION
+    assert measurements[0].spectrum_count == 2
+    assert measurements[2].spectroscopy_type is SpectroscopyType.FLUORESCENCE
+    assert measurements[2].spectrum_count == 3
+    
+    data = SpectroscopyDataSourceFactory.load_many_data([fluorescence, empty], SpectroscopyType.FLUORESCENCE)
+    assert [len(spectra) for spectra in data] == [3, 0]
+    assert [spectrum.excitation_wavelength for spectrum in data[0]] == [300.0, 310.0, 320.0]
+
+
+def test_measurement_indices_and_validation(spectral_data, monkeypatch):
+    """Name and excitation lookups, replace(), and the spectroscopy type check."""
+    import dataclasses
+    import subprocess
+    from hyrcania.domain.models import measurement as measurement_module
+    from hyrcania.domain.models.measurement import Measurement, AgingStep, skip_spectra_validation
+    from hyrcania.domain.models.spectrum import SpectralData, Spectrum, SpectroscopyType
+    
+    def spectrum(name, data):
+        return Spectrum(spectral_data=data, measurement_name=name, aging_step=1, sample_id="S1")
+    
+    def measurement(spectra):
+        return Measurement(
+            measurement_id="m1",
+            aging_step=AgingStep.STEP_1,
+            spectroscopy_type=SpectroscopyType.FLUORESCENCE,
+            spectra=spectra
+        )
+    
+    other = dataclasses.replace(spectral_data, excitation_wavelength=310.0)
+    first, duplicate, second = spectrum("a", spectral_data), spectrum("a", other), spectrum("b", other)
+    m = measurement([first, duplicate, second])
+    
+    assert m.get_spectrum_by_name("a") is first
+    assert m.get_spectrum_by_name("missing") is None
+    assert m.get_spectra_by_excitation(310.0) == [duplicate, second]
+    assert m.get_spectra_by_excitation(400.0) == []
+    m.get_spectra_by_excitation(300.0).clear()
+    assert m.get_spectra_by_excitation(300.0) == [first]
+    
+    # replace() runs __post_init__ again and rebuilds the indices
+    derived = dataclasses.replace(m, spectra=[second])
+    assert derived.get_spectrum_by_name("a") is None
+    assert derived.get_spectra_by_excitation(300.0) == []
+    assert m.get_spectrum_by_name("a") is first
+    
+    absorption = SpectralData(
+        wavelengths=spectral_data.wavelengths,
+        intensities=spectral_data.intensities,
+        spectroscopy_type=SpectroscopyType.ABSORPTION
+    )
+    mixed = [first, spectrum("c", absorption)]
+    with pytest.raises(ValueError, match="same spectroscopy type"):
+        measurement(mixed)
+    with skip_spectra_validation():
+        assert measurement(mixed).spectrum_count == 2
+    with pytest.raises(ValueError, match="same spectroscopy type"):
+        measurement(mixed)
+    
+    monkeypatch.setattr(measurement_module, '_VALIDATE', False)
+    assert measurement(mixed).spectrum_count == 2
+    
+    # The module-level switch is read from HYRCANIA_VALIDATE at import time
+    code = "from hyrcania.domain.models import measurement; print(measurement._VALIDATE)"
+    for value, expected in (("0", "False"), ("1", "True")):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "HYRCANIA_VALIDATE": value, "PYTHONPATH": str(Path(__file__).parent.parent)},
+            capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == expected
+
+
+# Metric combinations with present, missing (None), NaN and boundary values
+_METRIC_CASES = [
+    dict(acidity=0.5, peroxide_value=15.0, k232=2.0, k270=0.15),
+    dict(acidity=0.8, peroxide_value=20.0, k232=2.5, k270=0.22, flavor_score=95.0, aroma_score=85.0),
+    dict(acidity=1.2, peroxide_value=35.0, k232=3.1, k270=0.4, flavor_score=40.0),
+    dict(acidity=float('nan'), k232=2.0, aroma_score=70.0),
+    dict(peroxide_value=float('nan'), flavor_score=float('nan')),
+    dict(acidity=3.0, peroxide_value=80.0),
+    dict(),
+]
+
+
+def _reference_score(metrics):
+    """Overall score computed metric by metric, as calculate_overall_score always has."""
+    scores = []
+    for value, limit, penalty in zip(
+        (metrics.acidity, metrics.peroxide_value, metrics.k232, metrics.k270),
+        (0.8, 20.0, 2.5, 0.22),
+        (50.0, 2.0, 20.0, 200.0)
+    ):
+        if value is not None:
+            scores.append(100 - (value / limit) * 20 if value <= limit else max(0, 80 - (value - limit) * penalty))
+    scores.extend(value for value in (metrics.flavor_score, metrics.aroma_score) if value is not None)
+    return sum(scores) / len(scores) if scores else 0.0
+
+
+def _reference_compliance(threshold, metrics):
+    """Compliance dict built metric by metric, as check_compliance always has."""
+    checks = [
+        ('acidity', metrics.acidity, lambda v: v <= threshold.max_acidity),
+        ('peroxide_value', metrics.peroxide_value, lambda v: v <= threshold.max_peroxide_value),
+        ('k232', metrics.k232, lambda v: v <= threshold.max_k232),
+        ('k270', metrics.k270, lambda v: v <= threshold.max_k270),
+        ('flavor', metrics.flavor_score, lambda v: v >= threshold.min_flavor_score),
+        ('aroma', metrics.aroma_score, lambda v: v >= threshold.min_aroma_score),
+    ]
+    return {key: check(value) for key, value, check in checks if value is not None}
+
+
+def test_quality_scores():
+    """Batch and array scoring agree with the per-metric overall score and grade."""
+    import numpy as np
+    from hyrcania.domain.models.quality import (
+        QualityMetrics, QualityGrade, overall_score, grade_codes, grade_from_code
+    )
+    
+    metrics = [QualityMetrics(**case) for case in _METRIC_CASES]
+    expected = np.array([_reference_score(m) for m in metrics])
+    
+    arrays = [m.to_array() for m in metrics]
+    values = np.stack([values for values, _ in arrays])
+    mask = np.stack([mask for _, mask in arrays])
+    np.testing.assert_allclose(QualityMetrics.score_batch(values, mask), expected, equal_nan=True)
+    
+    for m, score in zip(metrics, expected):
+        np.testing.assert_allclose(m.calculate_overall_score(), score, equal_nan=True)
+    
+    # overall_score treats NaN as missing, unlike the scalar API, so compare on NaN-free cases
+    columns = {name: values[:, i] for i, name in enumerate(
+        ('acidity', 'peroxide_value', 'k232', 'k270', 'flavor_score', 'aroma_score')
+    )}
+    finite = ~(np.isnan(values) & mask).any(axis=1)
+    np.testing.assert_allclose(overall_score(**columns)[finite], expected[finite])
+    
+    codes = grade_codes(expected)
+    assert codes.dtype == np.int8
+    assert [grade_from_code(code) for code in codes] == [m.determine_quality_grade() for m in metrics]
+    
+    cutoffs = np.array([np.nan, 0.0, 59.9, 60.0, 79.9, 80.0, 89.9, 90.0, 100.0])
+    assert [grade_from_code(code) for code in grade_codes(cutoffs)] == [
+        QualityGrade.REFINED, QualityGrade.REFINED, QualityGrade.REFINED,
+        QualityGrade.LAMPANTE, QualityGrade.LAMPANTE, QualityGrade.VIRGIN,
+        QualityGrade.VIRGIN, QualityGrade.EXTRA_VIRGIN, QualityGrade.EXTRA_VIRGIN,
+    ]
+
+
+def test_quality_compliance():
+    """Bitmask, batch and dict compliance agree for present, missing and NaN metrics."""
+    import numpy as np
+    from hyrcania.domain.models.quality import (
+        QualityMetrics, QualityGrade, QualityThreshold, compliance_to_dict
+    )
+    
+    threshold = QualityThreshold(
+        grade=QualityGrade.EXTRA_VIRGIN,
+        max_acidity=0.8,
+        max_peroxide_value=20.0,
+        max_k232=2.5,
+        max_k270=0.22,
+        min_flavor_score=80.0,
+        min_aroma_score=80.0
+    )
+    metrics = [QualityMetrics(**case) for case in _METRIC_CASES]
+    
+    arrays = [m.to_array() for m in metrics]
+    values = np.stack([values for values, _ in arrays])
+    mask = np.stack([mask for _, mask in arrays])
+    batch_flags = threshold.check_compliance_batch(values, mask)
+    assert batch_flags.dtype == np.uint8
+    
+    for m, row_mask, batch_flag in zip(metrics, mask, batch_flags):
+        expected = _reference_compliance(threshold, m)
+        flags = threshold.compliance_flags(m)
+        present = int(np.packbits(row_mask, bitorder='little')[0])
+        
+        assert threshold.check_compliance(m) == expected
+        assert compliance_to_dict(flags, present) == expected
+        assert int(batch_flag) == flags
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))